@@ -83,8 +83,18 @@ class AnalysisResult:
     volume_insights: List[str]
 
 class SolanaContractAnalyzer:
-    def __init__(self):
-        self.session: Optional[aiohttp.ClientSession] = None
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None,
+                 db=None):
+        # An injected session is shared with the caller (who keeps
+        # ownership and closes it); without one we open our own in
+        # __aenter__ and tear it down in __aexit__
+        self.session = session
+        self._owns_session = session is None
+        # Database handle, injected the same way: callers running many
+        # analyses (scanners) pass their ContractDatabase so saves all
+        # land on one writer; standalone use falls back lazily to the
+        # process-wide shared instance on first save
+        self.db = db
         self.known_scam_patterns = self._load_scam_patterns()
         
     def _load_scam_patterns(self) -> Dict:
@@ -100,12 +110,15 @@ class SolanaContractAnalyzer:
             return {"patterns": [], "blacklisted_addresses": []}
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+            self._owns_session = True
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
     
     async def _rpc_call(self, method: str, params: List) -> Dict:
         """Make a Solana RPC call."""
@@ -692,15 +705,17 @@ class SolanaContractAnalyzer:
         return result
     
     async def _save_analysis(self, result: AnalysisResult):
-        """Save analysis to SQLite database for learning."""
-        from database import ContractDatabase
-        
-        db = ContractDatabase()
-        success = db.save_analysis(result)
-        if success:
-            print("  💾 Saved to database")
-        else:
-            print("  ⚠️ Failed to save to database")
+        """Queue the analysis for persistence.
+
+        save_analysis only enqueues onto the shared writer thread, so
+        nothing here can claim the write succeeded; callers that need
+        the row committed use db.flush().
+        """
+        if self.db is None:
+            from database import get_database
+            self.db = get_database()
+        self.db.save_analysis(result)
+        print("  💾 Queued for database save")
 
 
 def print_analysis(result: AnalysisResult):
@@ -111,7 +111,7 @@ async def analyze_tokens(addresses: List[str]):
         for gem in sorted(results["gems"], key=lambda x: x.get("overall_risk_score", 50)):
             print(f"   • {gem.get('contract_address')[:25]}... | Risk: {gem.get('overall_risk_score')}/100 | Liq: ${gem.get('liquidity_usd'):,.0f}")
     
-    print(f"\n📦 Total tokens in database: {len(db.get_all_contracts(limit=1000))}")
+    print(f"\n📦 Total tokens in database: {len(list(db.get_all_contracts(limit=1000)))}")
     
     return results
 
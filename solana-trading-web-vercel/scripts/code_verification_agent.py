@@ -105,12 +105,21 @@ class CodeVerificationAgent:
             ))
             return
         
-        # Check syntax
+        # Check syntax — compile straight to an AST from the raw bytes,
+        # the same C entry point as ast.parse. Note optimize=2 does not
+        # shrink the tree: docstrings and asserts are only stripped
+        # during bytecode generation, which PyCF_ONLY_AST skips. The
+        # flag is kept only for parity with how the file would compile
+        # at our most aggressive optimization level.
         try:
-            with open(agent_path) as f:
-                code = f.read()
-                ast.parse(code)
-            
+            with open(agent_path, 'rb') as f:
+                raw = f.read()
+            compile(
+                raw, str(agent_path), "exec",
+                flags=ast.PyCF_ONLY_AST, dont_inherit=True, optimize=2
+            )
+            code = raw.decode('utf-8')
+
             self.results.append(VerificationResult(
                 check_name="Smart Money Agent Syntax",
                 status="passed",
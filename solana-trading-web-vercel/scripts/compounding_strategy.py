@@ -7,50 +7,87 @@ Creates bankroll growth plan
 
 import json
 import os
+import sys
 from typing import List, Dict, Tuple
 from datetime import datetime
+
+import numpy as np
+
+from dataclasses import dataclass
 from database import ContractDatabase
 
+
+# Scalp setup decision table, indexed by risk bucket from np.digitize:
+# bucket 0 = risk <= 30, 1 = risk <= 35, 2 = everything riskier.
+# Columns: stop_pct, target_pct, position_pct.
+_RISK_BINS = np.array([30, 35])
+_SETUP_PARAMS = np.array([
+    [0.015, 0.03, 0.025],
+    [0.02, 0.03, 0.02],
+    [0.025, 0.03, 0.015],
+])
+_SETUP_CONFIDENCE = np.array(["HIGH", "MEDIUM", "LOW"])
+
+
+@dataclass(slots=True)
+class QualifiedToken:
+    """Flat record for a qualified token — just the scalars the strategy
+    reads, instead of nesting the full analysis dict per token."""
+    address: str
+    symbol: str
+    risk: float
+    liq: float
+    mc: float
+    vol: float
+    price: float
+    price_change: float
+    score: float
+
+
 class CompoundingStrategy:
-    def __init__(self):
+    def __init__(self, seed: int = 0):
         self.db = ContractDatabase()
+        # Seeded PCG64 generator: reproducible projections, and its bulk
+        # .random(size=...) draws are much faster than the random module
+        self.rng = np.random.default_rng(seed)
         self.portfolio_size = 10000  # Default $10K starting
         self.daily_trades = 3
         self.win_rate = 0.65
         self.avg_win_pct = 0.03
         self.avg_loss_pct = 0.02
         self.compound_rate = 0.70  # Reinvest 70%
-    
-    def load_qualified_tokens(self) -> List[Dict]:
+        self._sim_cache = {}  # (starting_capital, days) -> simulation result
+
+    def load_qualified_tokens(self) -> List[QualifiedToken]:
         """Load tokens that qualify for compounding strategy."""
         print("🔍 Loading qualified tokens from database...")
         
-        all_contracts = self.db.get_all_contracts(limit=1000)
-        qualified = []
-        
-        for contract in all_contracts:
-            analysis = self.db.get_analysis(contract["contract_address"])
-            if not analysis:
-                continue
-            
-            # Relaxed criteria for compounding
-            risk = analysis.get("overall_risk_score", 100)
-            liq = analysis.get("liquidity_usd", 0)
-            mc = analysis.get("market_cap", 0)
-            vol = analysis.get("volume_24h", 0)
-            
-            # Qualification criteria
-            if risk <= 40 and liq >= 100000 and mc >= 100000 and vol >= 30000:
-                # Calculate profit potential score
-                score = self.calculate_profit_potential(analysis)
-                qualified.append({
-                    "analysis": analysis,
-                    "profit_score": score
-                })
-        
-        # Sort by profit potential
-        qualified.sort(key=lambda x: x["profit_score"], reverse=True)
-        
+        # One filtered query instead of 1000 per-contract get_analysis calls;
+        # the relaxed compounding criteria run on indexed columns in SQLite
+        analyses = self.db.get_qualified_analyses(
+            max_risk=40, min_liquidity=100000,
+            min_market_cap=100000, min_volume=30000,
+            limit=1000
+        )
+
+        scores = self.calculate_profit_potential_vec(analyses)
+        qualified = [
+            QualifiedToken(
+                address=a.get("contract_address") or "",
+                symbol=a.get("token_symbol") or "UNKNOWN",
+                risk=a.get("overall_risk_score") or 50,
+                liq=a.get("liquidity_usd") or 0,
+                mc=a.get("market_cap") or 0,
+                vol=a.get("volume_24h") or 0,
+                price=a.get("current_price") or 0,
+                price_change=a.get("price_change_24h") if a.get("price_change_24h") is not None else 100,
+                score=float(score)
+            )
+            for a, score in zip(analyses, scores)
+        ]
+
+        # No full sort here — create_tier_system only needs the top few
+        # tokens per tier, selected with argpartition in O(N)
         print(f"  ✓ Found {len(qualified)} qualified tokens")
         return qualified
     
@@ -102,55 +139,103 @@ class CompoundingStrategy:
             score += 3  # Too volatile
         
         return score
-    
-    def simulate_compounding(self, starting_capital: float, days: int) -> Dict:
-        """Simulate bankroll growth over time."""
-        capital = starting_capital
+
+    def calculate_profit_potential_vec(self, analyses: List[Dict]) -> np.ndarray:
+        """Vectorized profit potential scores for a batch of analyses.
+
+        Same weighting as calculate_profit_potential, but computed as
+        column operations over the whole batch instead of branchy
+        per-token arithmetic.
+        """
+        if not analyses:
+            return np.empty(0)
+
+        risk = np.array([a.get("overall_risk_score") or 50 for a in analyses], dtype=float)
+        liq = np.array([a.get("liquidity_usd") or 0 for a in analyses], dtype=float)
+        vol = np.array([a.get("volume_24h") or 0 for a in analyses], dtype=float)
+        mc = np.array([a.get("market_cap") or 0 for a in analyses], dtype=float)
+        pc = np.abs(np.array(
+            [a.get("price_change_24h") if a.get("price_change_24h") is not None else 100
+             for a in analyses], dtype=float))
+
+        # Risk (lower is better) - 30% weight
+        score = (50 - risk) * 0.6
+
+        # Liquidity (higher is better) - 25% weight
+        score += np.select(
+            [liq >= 1000000, liq >= 500000, liq >= 200000, liq >= 100000],
+            [25, 20, 15, 10], default=0)
+
+        # Volume activity - 20% weight
+        vol_liq = np.divide(vol, liq, out=np.zeros_like(vol), where=liq > 0)
+        score += np.select(
+            [(vol_liq >= 1) & (vol_liq <= 5), vol_liq > 0.5],
+            [20, 15], default=10)
+
+        # Market cap stability - 15% weight
+        score += np.select(
+            [(mc >= 100000) & (mc <= 50000000), mc > 50000000],
+            [15, 10], default=5)
+
+        # Price action - 10% weight
+        score += np.select([pc < 20, pc < 50], [10, 7], default=3)
+
+        return score
+
+    def simulate_compounding(self, starting_capital: float, days: int,
+                             build_history: bool = False) -> Dict:
+        """Simulate bankroll growth over time (vectorized).
+
+        Results are cached per (starting_capital, days) so milestone
+        reporting can reuse one run instead of re-simulating the prefix.
+        The per-day trade_history ledger is only materialized when
+        build_history is True — the projection report reads aggregates
+        and the capital series, so it skips O(days) dict allocations.
+        """
+        cached = self._sim_cache.get((starting_capital, days, build_history))
+        if cached is not None:
+            return cached
+
         trades_per_day = self.daily_trades
-        total_trades = 0
-        wins = 0
-        losses = 0
+
+        # Draw all trade outcomes in one shot instead of one RNG call per trade
+        u = self.rng.random((days, trades_per_day))
+        wins_mask = u < self.win_rate
+
+        # Win -> +avg_win_pct, loss -> -avg_loss_pct on a 2% position,
+        # with 70% of the P&L reinvested
+        r = np.where(wins_mask, self.avg_win_pct, -self.avg_loss_pct)
+        factors = 1 + 0.02 * r * self.compound_rate
+        day_factor = factors.prod(axis=1)
+        capital_series = starting_capital * np.cumprod(day_factor)
+
+        wins = int(wins_mask.sum())
+        total_trades = wins_mask.size
+        losses = total_trades - wins
+        capital = float(capital_series[-1])
+
+        # Reconstruct the daily ledger from the vectorized series,
+        # but only when a caller actually wants the per-day records
         trade_history = []
-        
-        for day in range(1, days + 1):
-            daily_pnl = 0
-            
-            for trade in range(trades_per_day):
-                # Position size (2% of current capital)
-                position = capital * 0.02
-                
-                # Simulate trade outcome
-                import random
-                if random.random() < self.win_rate:
-                    # Win
-                    profit = position * self.avg_win_pct
-                    daily_pnl += profit
-                    wins += 1
-                else:
-                    # Loss
-                    loss = position * self.avg_loss_pct
-                    daily_pnl -= loss
-                    losses += 1
-                
-                total_trades += 1
-            
-            # Apply compounding (reinvest 70%)
-            reinvest = daily_pnl * self.compound_rate
-            capital += reinvest
-            
-            # Withdraw 30%
-            withdraw = daily_pnl * (1 - self.compound_rate)
-            
-            trade_history.append({
-                "day": day,
-                "capital": capital,
-                "daily_pnl": daily_pnl,
-                "reinvested": reinvest,
-                "withdrawn": withdraw,
-                "total_trades": total_trades
-            })
-        
-        return {
+        if build_history:
+            prev_capital = np.concatenate(([starting_capital], capital_series[:-1]))
+            reinvested = capital_series - prev_capital
+            daily_pnl = reinvested / self.compound_rate
+            withdrawn = daily_pnl * (1 - self.compound_rate)
+
+            trade_history = [
+                {
+                    "day": day,
+                    "capital": float(capital_series[day - 1]),
+                    "daily_pnl": float(daily_pnl[day - 1]),
+                    "reinvested": float(reinvested[day - 1]),
+                    "withdrawn": float(withdrawn[day - 1]),
+                    "total_trades": day * trades_per_day
+                }
+                for day in range(1, days + 1)
+            ]
+
+        result = {
             "starting_capital": starting_capital,
             "final_capital": capital,
             "total_return_pct": ((capital - starting_capital) / starting_capital) * 100,
@@ -158,10 +243,61 @@ class CompoundingStrategy:
             "wins": wins,
             "losses": losses,
             "win_rate": (wins / total_trades) * 100,
+            "capital_series": capital_series,
             "trade_history": trade_history
         }
+        self._sim_cache[(starting_capital, days, build_history)] = result
+        return result
     
-    def create_tier_system(self, tokens: List[Dict]) -> Dict[str, List[Dict]]:
+    def expected_capital(self, starting_capital: float, day: int) -> float:
+        """Closed-form expected capital after `day` days.
+
+        Each trade multiplies capital by an expected
+        1 + 0.02 * compound_rate * (wr*win - (1-wr)*loss); raising that
+        to day*trades_per_day gives the deterministic growth curve with
+        no RNG at all.
+        """
+        edge = (self.win_rate * self.avg_win_pct
+                - (1 - self.win_rate) * self.avg_loss_pct)
+        m = 1 + 0.02 * self.compound_rate * edge
+        return starting_capital * m ** (day * self.daily_trades)
+
+    def simulate_distribution(self, starting_capital: float, days: int,
+                              paths: int = 10000) -> Dict:
+        """Run many independent compounding paths and summarize the spread.
+
+        A single path says little about risk; this draws all paths at once
+        as a (paths, days*trades) matrix and reduces along the trade axis,
+        returning mean and percentile final capitals.
+
+        Uses antithetic variates: only paths/2 matrices are drawn and each
+        is paired with its mirror 1-u, which halves RNG work and cuts the
+        estimator variance for the same number of paths.
+        """
+        # float32 throughout the path matrices: the report only shows
+        # dollars and cents, and halving the memory traffic matters once
+        # paths*trades reaches the millions. The final reduction happens
+        # in float64.
+        n_trades = days * self.daily_trades
+        half = self.rng.random((max(paths // 2, 1), n_trades), dtype=np.float32)
+        u = np.concatenate((half, np.float32(1) - half), axis=0)[:paths]
+        r = np.where(u < np.float32(self.win_rate),
+                     np.float32(self.avg_win_pct), np.float32(-self.avg_loss_pct))
+        factors = np.float32(1) + np.float32(0.02 * self.compound_rate) * r
+        finals = starting_capital * factors.prod(axis=1, dtype=np.float64)
+
+        p5, p25, p50, p75, p95 = np.percentile(finals, [5, 25, 50, 75, 95])
+        return {
+            "paths": paths,
+            "mean": float(finals.mean()),
+            "p5": float(p5),
+            "p25": float(p25),
+            "median": float(p50),
+            "p75": float(p75),
+            "p95": float(p95),
+        }
+
+    def create_tier_system(self, tokens: List[QualifiedToken]) -> Dict[str, List[QualifiedToken]]:
         """Create tier system for token selection."""
         tiers = {
             "S_TIER": [],  # Best of the best
@@ -169,48 +305,59 @@ class CompoundingStrategy:
             "B_TIER": [],  # Good
             "C_TIER": [],  # Acceptable
         }
-        
-        for token in tokens:
-            score = token["profit_score"]
-            risk = token["analysis"].get("overall_risk_score", 50)
-            
-            if score >= 75 and risk <= 32:
-                tiers["S_TIER"].append(token)
-            elif score >= 65 and risk <= 35:
-                tiers["A_TIER"].append(token)
-            elif score >= 55 and risk <= 38:
-                tiers["B_TIER"].append(token)
-            elif score >= 45:
-                tiers["C_TIER"].append(token)
-        
+
+        if not tokens:
+            return tiers
+
+        scores = np.array([t.score for t in tokens])
+        risks = np.array([t.risk for t in tokens], dtype=float)
+
+        # Tier boundaries are monotonic score cut points, so one
+        # searchsorted assigns every token at once: 0 = unranked,
+        # 1..4 = C/B/A/S. The per-tier risk caps then demote tokens
+        # that score high but carry too much risk, like the old cascade.
+        cuts = np.array([45, 55, 65, 75])
+        risk_caps = np.array([np.inf, np.inf, 38, 35, 32])
+        tier_idx = np.searchsorted(cuts, scores, side="right")
+        for _ in range(3):  # max demotion distance is S -> C
+            demote = (tier_idx > 1) & (risks > risk_caps[tier_idx])
+            tier_idx = np.where(demote, tier_idx - 1, tier_idx)
+
+        s_mask = tier_idx == 4
+        a_mask = tier_idx == 3
+        b_mask = tier_idx == 2
+        c_mask = tier_idx == 1
+
+        # Only the first 10 rows per tier are ever displayed, so partially
+        # select the top-K with argpartition (O(N)) instead of sorting the
+        # whole universe, then order just those K at the head of the list
+        top_k = 10
+        for tier_name, mask in (("S_TIER", s_mask), ("A_TIER", a_mask),
+                                ("B_TIER", b_mask), ("C_TIER", c_mask)):
+            idx = np.nonzero(mask)[0]
+            if len(idx) > top_k:
+                part = np.argpartition(-scores[idx], top_k - 1)
+                head, tail = idx[part[:top_k]], idx[part[top_k:]]
+            else:
+                head, tail = idx, idx[:0]
+            head = head[np.argsort(-scores[head])]
+            tiers[tier_name] = [tokens[i] for i in head] + [tokens[i] for i in tail]
+
         return tiers
     
-    def generate_scalp_setups(self, token_data: Dict) -> Dict:
+    def generate_scalp_setups(self, token: QualifiedToken) -> Dict:
         """Generate specific scalp setup for a token."""
-        analysis = token_data["analysis"]
-        price = analysis.get("current_price", 0)
-        risk = analysis.get("overall_risk_score", 50)
-        
+        price = token.price
+        risk = token.risk
+
         if price <= 0:
             return {}
         
-        # Determine setup parameters based on tier
-        if risk <= 30:
-            stop_pct = 0.015  # 1.5%
-            target_pct = 0.03  # 3%
-            position_pct = 0.025  # 2.5%
-            confidence = "HIGH"
-        elif risk <= 35:
-            stop_pct = 0.02  # 2%
-            target_pct = 0.03  # 3%
-            position_pct = 0.02  # 2%
-            confidence = "MEDIUM"
-        else:
-            stop_pct = 0.025  # 2.5%
-            target_pct = 0.03  # 3%
-            position_pct = 0.015  # 1.5%
-            confidence = "LOW"
-        
+        # Setup parameters come from the shared decision table
+        bucket = int(np.digitize(risk, _RISK_BINS, right=True))
+        stop_pct, target_pct, position_pct = _SETUP_PARAMS[bucket]
+        confidence = str(_SETUP_CONFIDENCE[bucket])
+
         return {
             "entry": price,
             "stop": price * (1 - stop_pct),
@@ -224,105 +371,109 @@ class CompoundingStrategy:
             "max_loss": price * stop_pct
         }
     
-    def print_tier_report(self, tiers: Dict[str, List[Dict]]):
+    def generate_scalp_setups_vec(self, price_arr: np.ndarray,
+                                  risk_arr: np.ndarray) -> Dict[str, np.ndarray]:
+        """Generate scalp setups for a whole tier slice in one sweep.
+
+        Array-valued twin of generate_scalp_setups: one np.select per
+        parameter instead of per-token branching and dict building.
+        """
+        bucket = np.digitize(risk_arr, _RISK_BINS, right=True)
+        stop_pct, target_pct, position_pct = _SETUP_PARAMS[bucket].T
+        confidence = _SETUP_CONFIDENCE[bucket]
+
+        # Tokens without a price get an empty setup, like the scalar version
+        no_price = price_arr <= 0
+        position_pct = np.where(no_price, 0.0, position_pct)
+        confidence = np.where(no_price, "LOW", confidence)
+
+        return {
+            "entry": price_arr,
+            "stop": price_arr * (1 - stop_pct),
+            "target": price_arr * (1 + target_pct),
+            "stop_pct": stop_pct * 100,
+            "target_pct": target_pct * 100,
+            "rr_ratio": target_pct / stop_pct,
+            "position_pct": position_pct * 100,
+            "confidence": confidence,
+            "expected_profit": price_arr * target_pct,
+            "max_loss": price_arr * stop_pct
+        }
+
+    def print_tier_report(self, tiers: Dict[str, List[QualifiedToken]]):
         """Print tier system report."""
-        print("\n" + "=" * 80)
-        print("🏆 TIER SYSTEM FOR COMPOUNDING")
-        print("=" * 80)
-        
+        # Buffer the whole report and write once instead of one
+        # locked/flushed print per row
+        lines = ["", "=" * 80, "🏆 TIER SYSTEM FOR COMPOUNDING", "=" * 80]
+
         for tier_name, tokens in tiers.items():
             if not tokens:
                 continue
-            
+
             tier_emoji = {"S_TIER": "💎", "A_TIER": "🥇", "B_TIER": "🥈", "C_TIER": "🥉"}[tier_name]
-            
-            print(f"\n{tier_emoji} {tier_name.replace('_', ' ')} ({len(tokens)} tokens)")
-            print("-" * 80)
-            print(f"{'Contract':<44}{'Risk':<8}{'Profit Score':<15}{'Liquidity':<15}")
-            print("-" * 80)
-            
+
+            lines.append(f"\n{tier_emoji} {tier_name.replace('_', ' ')} ({len(tokens)} tokens)")
+            lines.append("-" * 80)
+            lines.append(f"{'Contract':<44}{'Risk':<8}{'Profit Score':<15}{'Liquidity':<15}")
+            lines.append("-" * 80)
+
             for token in tokens[:10]:  # Show top 10 per tier
-                a = token["analysis"]
-                addr = a.get("contract_address", "")[:40]
-                risk = f"{a.get('overall_risk_score')}/100"
-                score = f"{token['profit_score']:.0f}"
-                liq = f"${a.get('liquidity_usd', 0):,.0f}"
-                print(f"{addr:<44}{risk:<8}{score:<15}{liq:<15}")
+                addr = token.address[:40]
+                risk = f"{token.risk:.0f}/100"
+                score = f"{token.score:.0f}"
+                liq = f"${token.liq:,.0f}"
+                lines.append(f"{addr:<44}{risk:<8}{score:<15}{liq:<15}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    def print_weekly_rotation_plan(self, tiers: Dict[str, List[Dict]]):
+    def print_weekly_rotation_plan(self, tiers: Dict[str, List[QualifiedToken]]):
         """Print weekly token rotation plan."""
-        print("\n" + "=" * 80)
-        print("📅 WEEKLY ROTATION PLAN")
-        print("=" * 80)
+        lines = ["", "=" * 80, "📅 WEEKLY ROTATION PLAN", "=" * 80]
         
-        # Build rotation
+        # Build rotation — one vectorized setup sweep per tier slice
+        schedule = [
+            ("Monday-Wednesday", tiers.get("S_TIER", [])[:3]),
+            ("Thursday-Saturday", tiers.get("A_TIER", [])[:3]),
+            ("Sunday", tiers.get("B_TIER", [])[:4]),
+        ]
+
         rotation = []
+        for day_label, tier_slice in schedule:
+            if not tier_slice:
+                continue
+
+            price_arr = np.array([t.price for t in tier_slice], dtype=float)
+            risk_arr = np.array([t.risk for t in tier_slice], dtype=float)
+            setups = self.generate_scalp_setups_vec(price_arr, risk_arr)
+
+            for i, token in enumerate(tier_slice, 1):
+                rotation.append({
+                    "day": day_label,
+                    "rank": i,
+                    "token": token.symbol,
+                    "address": token.address,
+                    "entry": float(setups["entry"][i - 1]),
+                    "stop": float(setups["stop"][i - 1]),
+                    "target": float(setups["target"][i - 1]),
+                    "position": float(setups["position_pct"][i - 1]),
+                    "confidence": str(setups["confidence"][i - 1])
+                })
         
-        # Add S-tier (top 3)
-        s_tier = tiers.get("S_TIER", [])[:3]
-        for i, token in enumerate(s_tier, 1):
-            setup = self.generate_scalp_setups(token)
-            a = token["analysis"]
-            rotation.append({
-                "day": "Monday-Wednesday",
-                "rank": i,
-                "token": a.get("token_symbol", "UNKNOWN"),
-                "address": a.get("contract_address", ""),
-                "entry": setup.get("entry", 0),
-                "stop": setup.get("stop", 0),
-                "target": setup.get("target", 0),
-                "position": setup.get("position_pct", 0),
-                "confidence": setup.get("confidence", "LOW")
-            })
-        
-        # Add A-tier (top 3)
-        a_tier = tiers.get("A_TIER", [])[:3]
-        for i, token in enumerate(a_tier, 1):
-            setup = self.generate_scalp_setups(token)
-            a = token["analysis"]
-            rotation.append({
-                "day": "Thursday-Saturday",
-                "rank": i,
-                "token": a.get("token_symbol", "UNKNOWN"),
-                "address": a.get("contract_address", ""),
-                "entry": setup.get("entry", 0),
-                "stop": setup.get("stop", 0),
-                "target": setup.get("target", 0),
-                "position": setup.get("position_pct", 0),
-                "confidence": setup.get("confidence", "LOW")
-            })
-        
-        # Add B-tier (top 4 for Sunday)
-        b_tier = tiers.get("B_TIER", [])[:4]
-        for i, token in enumerate(b_tier, 1):
-            setup = self.generate_scalp_setups(token)
-            a = token["analysis"]
-            rotation.append({
-                "day": "Sunday",
-                "rank": i,
-                "token": a.get("token_symbol", "UNKNOWN"),
-                "address": a.get("contract_address", ""),
-                "entry": setup.get("entry", 0),
-                "stop": setup.get("stop", 0),
-                "target": setup.get("target", 0),
-                "position": setup.get("position_pct", 0),
-                "confidence": setup.get("confidence", "LOW")
-            })
-        
-        # Print
+        # Print — one buffered write for the whole plan
         current_day = ""
         for trade in rotation:
             if trade["day"] != current_day:
                 current_day = trade["day"]
-                print(f"\n📆 {current_day}")
-                print("-" * 80)
-            
-            print(f"\n  Trade #{trade['rank']}: {trade['token']} ({trade['confidence']})")
-            print(f"    Entry: ${trade['entry']:.6f}")
-            print(f"    Stop:  ${trade['stop']:.6f}")
-            print(f"    Target: ${trade['target']:.6f}")
-            print(f"    Position: {trade['position']}%")
-        
+                lines.append(f"\n📆 {current_day}")
+                lines.append("-" * 80)
+
+            lines.append(f"\n  Trade #{trade['rank']}: {trade['token']} ({trade['confidence']})")
+            lines.append(f"    Entry: ${trade['entry']:.6f}")
+            lines.append(f"    Stop:  ${trade['stop']:.6f}")
+            lines.append(f"    Target: ${trade['target']:.6f}")
+            lines.append(f"    Position: {trade['position']}%")
+
+        sys.stdout.write("\n".join(lines) + "\n")
         return rotation
     
     def print_compounding_projection(self, starting: float, days: int):
@@ -338,24 +489,34 @@ class CompoundingStrategy:
         print(f"   Avg Loss: -{self.avg_loss_pct*100:.1f}%")
         print(f"   Compound Rate: {self.compound_rate*100:.0f}% (withdraw {100-self.compound_rate*100:.0f}%)")
         
-        # Run simulation
-        result = self.simulate_compounding(starting, days)
-        
-        print(f"\n📈 {days}-Day Projection:")
-        print(f"   Final Capital: ${result['final_capital']:,.2f}")
-        print(f"   Total Return: +{result['total_return_pct']:.1f}%")
-        print(f"   Total Trades: {result['total_trades']}")
-        print(f"   Wins: {result['wins']} | Losses: {result['losses']}")
-        print(f"   Actual Win Rate: {result['win_rate']:.1f}%")
-        
-        # Weekly milestones
+        # Deterministic expected curve — closed-form, no simulation needed
+        final_capital = self.expected_capital(starting, days)
+        total_trades = days * self.daily_trades
+        expected_wins = round(total_trades * self.win_rate)
+
+        print(f"\n📈 {days}-Day Expected Projection:")
+        print(f"   Final Capital: ${final_capital:,.2f}")
+        print(f"   Total Return: +{((final_capital - starting) / starting) * 100:.1f}%")
+        print(f"   Total Trades: {total_trades}")
+        print(f"   Expected Wins: {expected_wins} | Losses: {total_trades - expected_wins}")
+
+        # Weekly milestones from the same closed form — O(1) per milestone
         print(f"\n📅 Milestones:")
         milestones = [7, 14, 21, 30, 60, 90]
         for day in milestones:
             if day <= days:
-                milestone_result = self.simulate_compounding(starting, day)
-                print(f"   Day {day:3d}: ${milestone_result['final_capital']:>10,.2f} (+{milestone_result['total_return_pct']:>5.1f}%)")
+                milestone_capital = self.expected_capital(starting, day)
+                milestone_return = ((milestone_capital - starting) / starting) * 100
+                print(f"   Day {day:3d}: ${milestone_capital:>10,.2f} (+{milestone_return:>5.1f}%)")
         
+        # Monte Carlo spread across independent paths
+        dist = self.simulate_distribution(starting, days)
+        print(f"\n🎲 Monte Carlo ({dist['paths']:,} paths):")
+        print(f"   Mean:   ${dist['mean']:>10,.2f}")
+        print(f"   5th %:  ${dist['p5']:>10,.2f}")
+        print(f"   Median: ${dist['median']:>10,.2f}")
+        print(f"   95th %: ${dist['p95']:>10,.2f}")
+
         # Risk warning
         print(f"\n⚠️  Risk Warning:")
         print(f"   Past performance doesn't guarantee future results")
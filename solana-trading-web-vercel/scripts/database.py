@@ -4,31 +4,236 @@ Database module for Solana Contract Risk Analyzer
 Uses SQLite for storing contract analyses and risk data
 """
 
+import asyncio
+import atexit
+import functools
+import queue
 import sqlite3
+import struct
+import threading
+import time
 import json
 import os
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from dataclasses import asdict
 
+try:
+    # Rust-side serialization; walks dataclass trees without the asdict
+    # deep copy and decodes a few times faster than stdlib json
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+import zlib
+
+if zstd is not None:
+    _CCTX = zstd.ZstdCompressor(level=3)
+    _DCTX = zstd.ZstdDecompressor()
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
 DATABASE_PATH = os.path.join(
     os.path.dirname(__file__),
     "../data/contract_analysis.db"
 )
 
+# Hot-path SQL as module constants. sqlite3 keys its per-connection
+# statement cache on the SQL text, so passing the same object every call
+# guarantees the compiled plan is reused rather than re-parsed.
+# The ten per-factor scores, in the order they are packed into the
+# risk_factors BLOB (one byte per 0-100 score)
+_RISK_FIELDS = (
+    'mint_authority_risk', 'freeze_authority_risk', 'liquidity_risk',
+    'holder_concentration_risk', 'contract_age_risk', 'verification_risk',
+    'scam_pattern_risk', 'volume_risk', 'volatility_risk',
+    'price_manipulation_risk',
+)
+
+_ANALYSIS_COLS = (
+    'contract_address', 'timestamp', 'token_name', 'token_symbol', 'supply',
+    'decimals', 'mint_authority', 'freeze_authority', 'is_initialized',
+    'current_price', 'price_change_24h', 'market_cap', 'liquidity_usd', 'fdv',
+    'pairs_count', 'volume_24h', 'dex_platform', 'overall_risk_score',
+    'risk_rating', 'risk_factors', 'red_flags', 'green_flags',
+    'volume_insights', 'recommendation', 'risk_reward_ratio', 'raw_analysis',
+)
+
+# Proper upsert rather than INSERT OR REPLACE: the old form deleted the
+# existing row and re-inserted, bumping the autoincrement id and churning
+# index pages; DO UPDATE rewrites the row in place and keeps ids stable.
+SQL_INSERT_ANALYSIS = 'INSERT INTO contract_analysis ({}) VALUES ({})\n    ON CONFLICT(contract_address) DO UPDATE SET {}'.format(
+    ', '.join(_ANALYSIS_COLS),
+    ', '.join(':' + col for col in _ANALYSIS_COLS),
+    ', '.join(f'{col} = excluded.{col}' for col in _ANALYSIS_COLS[1:]),
+)
+
+SQL_INSERT_VOLUME = '''
+    INSERT INTO volume_data (
+        contract_address, timeframe, total_volume, avg_volume,
+        volume_spikes, suspicious_pattern, volume_trend, buy_sell_ratio,
+        liquidity_depth, price_volatility, timestamp
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(contract_address, timeframe) DO UPDATE SET
+        total_volume = excluded.total_volume,
+        avg_volume = excluded.avg_volume,
+        volume_spikes = excluded.volume_spikes,
+        suspicious_pattern = excluded.suspicious_pattern,
+        volume_trend = excluded.volume_trend,
+        buy_sell_ratio = excluded.buy_sell_ratio,
+        liquidity_depth = excluded.liquidity_depth,
+        price_volatility = excluded.price_volatility,
+        timestamp = excluded.timestamp
+'''
+
+SQL_INSERT_HISTORY = '''
+    INSERT INTO risk_history (
+        contract_address, timestamp, risk_score, risk_rating,
+        price, liquidity, volume_24h
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+SQL_GET_ANALYSIS = 'SELECT * FROM contract_analysis WHERE contract_address = ?'
+
+# One fully-built statement per sortable column. Interpolating order_by
+# per call produced a distinct SQL string each time, defeating the
+# prepared-statement cache; these four stay cache-resident.
+SQL_LIST_CONTRACTS = {
+    col: f'''
+        SELECT
+            contract_address,
+            token_name,
+            token_symbol,
+            timestamp,
+            overall_risk_score,
+            risk_rating,
+            current_price,
+            liquidity_usd,
+            volume_24h,
+            price_change_24h
+        FROM contract_analysis
+        ORDER BY {col} DESC
+        LIMIT ?
+    '''
+    for col in ('timestamp', 'overall_risk_score', 'liquidity_usd', 'volume_24h')
+}
+
+def _rows_as_dicts(cursor) -> List[Dict]:
+    """Fetch all remaining rows as plain dicts.
+
+    Dropping to raw tuples and zipping against one precomputed column
+    tuple skips the per-row sqlite3.Row wrapper plus its keys() walk;
+    callers still get mutable dicts, which several screeners rely on to
+    stash decoded fields back onto the row.
+    """
+    cursor.row_factory = None
+    cols = tuple(d[0] for d in cursor.description)
+    return [dict(zip(cols, row)) for row in cursor.fetchall()]
+
 class ContractDatabase:
     def __init__(self, db_path: str = None):
         self.db_path = db_path or DATABASE_PATH
         self._ensure_directory()
+        # One long-lived connection — schema parse, page cache warmup and
+        # pragma setup are paid once instead of on every call.
+        # check_same_thread is off so the asyncio.to_thread wrapper can
+        # share it; the sqlite3 module serializes access internally.
+        # isolation_level=None: the driver stops injecting implicit
+        # BEGINs; writes autocommit unless a transaction is opened
+        # explicitly, as the save path does
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                     cached_statements=256,
+                                     isolation_level=None)
+        self._configure(self._conn)
+        self._conn.row_factory = sqlite3.Row
         self.init_database()
+        # Dedicated read connection. Readers use `with ... as conn:`,
+        # and Connection.__exit__ issues a COMMIT — on the writer's
+        # connection that would commit the writer thread's in-flight
+        # BEGIN IMMEDIATE batch out from under it. Giving reads their
+        # own handle makes that commit a harmless no-op, and WAL lets
+        # the reader run concurrently with the writer.
+        self._read_conn = sqlite3.connect(self.db_path,
+                                          check_same_thread=False,
+                                          cached_statements=256,
+                                          isolation_level=None)
+        self._configure(self._read_conn)
+        self._read_conn.row_factory = sqlite3.Row
+        # Refresh planner stats as the tables grow; cheap sampling ANALYZE
+        self._writes_since_optimize = 0
+        # Blacklist membership is checked per discovered token — keep it
+        # resident so the hot check is a set lookup, not a query
+        self._blacklist = {
+            row[0] for row in
+            self._conn.execute('SELECT contract_address FROM blacklist')
+        }
+        # Single writer thread: save_analysis enqueues and returns, and
+        # bursts of saves coalesce into one transaction/fsync. SQLite
+        # only allows one writer at a time anyway.
+        self._write_q = queue.Queue(maxsize=1024)
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
     
     def _ensure_directory(self):
         """Ensure the data directory exists."""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-    
+
+    def _configure(self, conn: sqlite3.Connection):
+        """Apply session-scoped pragmas to a connection.
+
+        journal_mode=WAL persists on the database file and is set once in
+        init_database; everything here is per-connection state and must be
+        reissued each time. synchronous=NORMAL drops the per-commit fsync
+        (safe under WAL), temp_store keeps sort/temp b-trees off disk, and
+        the cache/mmap/busy settings keep hot pages in memory and stop
+        concurrent writers from erroring out immediately.
+        """
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        # 1 GB mmap window: reads resolve straight out of the kernel page
+        # cache, which every process on this DB (dashboard, analyzer CLI,
+        # scanners) shares — no read() syscalls and no duplicated page
+        # copies per process
+        conn.execute("PRAGMA mmap_size=1073741824")
+        conn.execute("PRAGMA busy_timeout=5000")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the long-lived read connection.
+
+        Never hands out the writer thread's connection: the
+        `with self._connect() as conn:` call sites commit on exit, and
+        doing that on the shared write handle would flush the writer's
+        in-flight batch mid-transaction. On this connection no
+        transaction is ever left open, so the exit commit is a no-op.
+        Rows come back as sqlite3.Row so callers get mapping access
+        without rebuilding dicts.
+        """
+        return self._read_conn
+
     def init_database(self):
-        """Initialize the database with tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        """Initialize the database with tables.
+
+        Runs on the write connection — safe as a transaction scope here
+        because the writer thread hasn't started yet.
+        """
+        with self._conn as conn:
+            # On a brand-new file, pick storage-level settings before the
+            # first page is written: 16 KB pages mean fewer page reads on
+            # the near-full scans (export/list/aggregates), and
+            # incremental auto_vacuum lets the maintenance pass reclaim
+            # free pages without a blocking full VACUUM. Both are baked
+            # into the file header and can't change once WAL is on.
+            if conn.execute("PRAGMA page_count").fetchone()[0] == 0:
+                conn.execute("PRAGMA page_size=16384")
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            # WAL is a property of the file, not the connection — writers
+            # stop blocking readers from here on
+            conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
             
             # Main contract analysis table
@@ -55,19 +260,12 @@ class ContractDatabase:
                     volume_24h REAL,
                     dex_platform TEXT,
                     
-                    -- Risk scores
+                    -- Risk scores: the ten per-factor scores are
+                    -- packed into one BLOB, one byte each, in
+                    -- _RISK_FIELDS order
                     overall_risk_score INTEGER,
                     risk_rating TEXT,
-                    mint_authority_risk INTEGER,
-                    freeze_authority_risk INTEGER,
-                    liquidity_risk INTEGER,
-                    holder_concentration_risk INTEGER,
-                    contract_age_risk INTEGER,
-                    verification_risk INTEGER,
-                    scam_pattern_risk INTEGER,
-                    volume_risk INTEGER,
-                    volatility_risk INTEGER,
-                    price_manipulation_risk INTEGER,
+                    risk_factors BLOB,
                     
                     -- Analysis data
                     top_10_concentration REAL,
@@ -90,7 +288,16 @@ class ContractDatabase:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
-            
+
+            # Databases created before the packed-BLOB schema carry ten
+            # individual *_risk INTEGER columns instead; add the BLOB
+            # column so new writes land, old columns just go stale
+            existing = {r[1] for r in cursor.execute(
+                "PRAGMA table_info(contract_analysis)")}
+            if 'risk_factors' not in existing:
+                cursor.execute(
+                    "ALTER TABLE contract_analysis ADD COLUMN risk_factors BLOB")
+
             # Volume data table (time series)
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS volume_data (
@@ -142,146 +349,268 @@ class ContractDatabase:
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_risk_score ON contract_analysis(overall_risk_score)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_timestamp ON contract_analysis(timestamp)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_rating ON contract_analysis(risk_rating)')
-            
+            # Composite indexes so the hot lookups run as index-only scans:
+            # get_lowest_risk's filter + two-column sort, per-contract
+            # risk history, and the (address, timeframe) volume upserts
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_risk_liq ON contract_analysis(overall_risk_score, liquidity_usd DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_history_addr_ts ON risk_history(contract_address, timestamp DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_volume_addr ON volume_data(contract_address, timeframe)')
+            cursor.execute('ANALYZE')
+
             conn.commit()
     
-    def save_analysis(self, result) -> bool:
-        """Save a contract analysis to the database."""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Extract data from result
-                data = {
-                    'contract_address': result.contract_address,
-                    'timestamp': result.timestamp,
-                    'token_name': result.token_metadata.name,
-                    'token_symbol': result.token_metadata.symbol,
-                    'supply': result.token_metadata.supply,
-                    'decimals': result.token_metadata.decimals,
-                    'mint_authority': result.token_metadata.mint_authority,
-                    'freeze_authority': result.token_metadata.freeze_authority,
-                    'is_initialized': result.token_metadata.is_initialized,
-                    
-                    'current_price': result.chart_metrics.current_price,
-                    'price_change_24h': result.chart_metrics.price_change_24h,
-                    'market_cap': result.chart_metrics.market_cap,
-                    'liquidity_usd': result.chart_metrics.liquidity_usd,
-                    'fdv': result.chart_metrics.fdv,
-                    'pairs_count': result.chart_metrics.pairs_count,
-                    'volume_24h': result.chart_metrics.volume_24h,
-                    'dex_platform': result.chart_metrics.dex_platform,
-                    
-                    'overall_risk_score': result.overall_risk_score,
-                    'risk_rating': result.risk_rating,
-                    'mint_authority_risk': result.risk_factors.mint_authority_risk,
-                    'freeze_authority_risk': result.risk_factors.freeze_authority_risk,
-                    'liquidity_risk': result.risk_factors.liquidity_risk,
-                    'holder_concentration_risk': result.risk_factors.holder_concentration_risk,
-                    'contract_age_risk': result.risk_factors.contract_age_risk,
-                    'verification_risk': result.risk_factors.verification_risk,
-                    'scam_pattern_risk': result.risk_factors.scam_pattern_risk,
-                    'volume_risk': result.risk_factors.volume_risk,
-                    'volatility_risk': result.risk_factors.volatility_risk,
-                    'price_manipulation_risk': result.risk_factors.price_manipulation_risk,
-                    
-                    'red_flags': json.dumps(result.red_flags),
-                    'green_flags': json.dumps(result.green_flags),
-                    'volume_insights': json.dumps(result.volume_insights),
-                    'recommendation': result.recommendation,
-                    'risk_reward_ratio': result.risk_reward_ratio,
-                    'raw_analysis': json.dumps(asdict(result), default=str)
-                }
-                
-                # Insert or replace
-                cursor.execute('''
-                    INSERT OR REPLACE INTO contract_analysis (
-                        contract_address, timestamp, token_name, token_symbol, supply,
-                        decimals, mint_authority, freeze_authority, is_initialized,
-                        current_price, price_change_24h, market_cap, liquidity_usd, fdv,
-                        pairs_count, volume_24h, dex_platform, overall_risk_score,
-                        risk_rating, mint_authority_risk, freeze_authority_risk,
-                        liquidity_risk, holder_concentration_risk, contract_age_risk,
-                        verification_risk, scam_pattern_risk, volume_risk, volatility_risk,
-                        price_manipulation_risk, red_flags, green_flags, volume_insights,
-                        recommendation, risk_reward_ratio, raw_analysis
-                    ) VALUES (
-                        :contract_address, :timestamp, :token_name, :token_symbol, :supply,
-                        :decimals, :mint_authority, :freeze_authority, :is_initialized,
-                        :current_price, :price_change_24h, :market_cap, :liquidity_usd, :fdv,
-                        :pairs_count, :volume_24h, :dex_platform, :overall_risk_score,
-                        :risk_rating, :mint_authority_risk, :freeze_authority_risk,
-                        :liquidity_risk, :holder_concentration_risk, :contract_age_risk,
-                        :verification_risk, :scam_pattern_risk, :volume_risk, :volatility_risk,
-                        :price_manipulation_risk, :red_flags, :green_flags, :volume_insights,
-                        :recommendation, :risk_reward_ratio, :raw_analysis
-                    )
-                ''', data)
-                
-                # Save volume data for each timeframe
-                for tf_name, tf_data in result.chart_metrics.timeframes.items():
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO volume_data (
-                            contract_address, timeframe, total_volume, avg_volume,
-                            volume_spikes, suspicious_pattern, volume_trend, buy_sell_ratio,
-                            liquidity_depth, price_volatility, timestamp
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        result.contract_address,
-                        tf_name,
-                        tf_data.total_volume,
-                        tf_data.avg_volume,
-                        tf_data.volume_spikes,
-                        tf_data.suspicious_volume_pattern,
-                        tf_data.volume_trend,
-                        tf_data.buy_sell_ratio,
-                        tf_data.liquidity_depth,
-                        tf_data.price_volatility,
-                        result.timestamp
-                    ))
-                
-                # Save to risk history
-                cursor.execute('''
-                    INSERT INTO risk_history (
-                        contract_address, timestamp, risk_score, risk_rating,
-                        price, liquidity, volume_24h
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    result.contract_address,
-                    result.timestamp,
-                    result.overall_risk_score,
-                    result.risk_rating,
-                    result.chart_metrics.current_price,
-                    result.chart_metrics.liquidity_usd,
-                    result.chart_metrics.volume_24h
-                ))
-                
-                conn.commit()
-                return True
-                
-        except Exception as e:
-            print(f"❌ Database error: {e}")
-            return False
+    @staticmethod
+    def _dump_raw(result) -> str:
+        """Serialize the full analysis result to JSON text."""
+        if orjson is not None:
+            return orjson.dumps(result, default=str).decode()
+        return json.dumps(asdict(result), default=str)
+
+    def _compress_raw(self, result) -> bytes:
+        """Serialize and compress the full analysis dump.
+
+        The JSON blobs are big and repetitive — compression typically
+        shrinks them 4-8x, meaning less page churn and smaller exports.
+        zstd level 3 when installed, zlib otherwise.
+        """
+        raw = self._dump_raw(result).encode()
+        if zstd is not None:
+            return _CCTX.compress(raw)
+        return zlib.compress(raw, 6)
+
+    @staticmethod
+    def load_raw_analysis(value):
+        """Decode a raw_analysis value written by any format so far:
+        compressed blob (zstd or zlib), JSON text, or NULL."""
+        if value is None:
+            return None
+        if isinstance(value, bytes):
+            if value[:4] == _ZSTD_MAGIC:
+                if zstd is None:
+                    raise RuntimeError(
+                        "zstandard is required to read this raw_analysis blob")
+                value = _DCTX.decompress(value)
+            else:
+                value = zlib.decompress(value)
+        if orjson is not None:
+            return orjson.loads(value)
+        return json.loads(value)
+
+    def save_analysis(self, result, save_raw: bool = False) -> None:
+        """Queue a contract analysis for persistence.
+
+        The write happens on the background writer thread, which batches
+        bursts into a single transaction; this call only blocks when the
+        queue is full and says nothing about whether the write will
+        succeed. Callers that need the row visible (and committed)
+        should follow up with flush().
+        """
+        self._write_q.put((result, save_raw))
+
+    def flush(self):
+        """Block until every queued write has been committed."""
+        self._write_q.join()
+
+    def _writer_loop(self):
+        """Drain the write queue, committing up to 64 saves per fsync."""
+        conn = self._conn
+        while True:
+            batch = [self._write_q.get()]
+            while len(batch) < 64:
+                try:
+                    batch.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                    for result, save_raw in batch:
+                        self._write_analysis(conn, result, save_raw)
+                    conn.execute("COMMIT")
+                except Exception:
+                    try:
+                        conn.execute("ROLLBACK")
+                    except sqlite3.OperationalError:
+                        pass
+                    # One bad record shouldn't drop its neighbours —
+                    # retry the batch one save at a time
+                    for result, save_raw in batch:
+                        try:
+                            conn.execute("BEGIN IMMEDIATE")
+                            self._write_analysis(conn, result, save_raw)
+                            conn.execute("COMMIT")
+                        except Exception as e:
+                            try:
+                                conn.execute("ROLLBACK")
+                            except sqlite3.OperationalError:
+                                pass
+                            print(f"❌ Database error: {e}")
+            finally:
+                for _ in batch:
+                    self._write_q.task_done()
+
+            self._stats_cached.cache_clear()
+            self._writes_since_optimize += len(batch)
+            if self._writes_since_optimize >= 1000:
+                self._writes_since_optimize = 0
+                conn.execute("PRAGMA optimize")
+                # Hand back a bounded slice of free pages each cycle so
+                # the freelist never needs a blocking full VACUUM
+                conn.execute("PRAGMA incremental_vacuum(1000)")
+
+    def _write_analysis(self, conn, result, save_raw: bool):
+        """Apply one save's three inserts on the caller's transaction."""
+        cursor = conn.cursor()
+
+        # Extract data from result
+        data = {
+            'contract_address': result.contract_address,
+            'timestamp': result.timestamp,
+            'token_name': result.token_metadata.name,
+            'token_symbol': result.token_metadata.symbol,
+            'supply': result.token_metadata.supply,
+            'decimals': result.token_metadata.decimals,
+            'mint_authority': result.token_metadata.mint_authority,
+            'freeze_authority': result.token_metadata.freeze_authority,
+            'is_initialized': result.token_metadata.is_initialized,
+            
+            'current_price': result.chart_metrics.current_price,
+            'price_change_24h': result.chart_metrics.price_change_24h,
+            'market_cap': result.chart_metrics.market_cap,
+            'liquidity_usd': result.chart_metrics.liquidity_usd,
+            'fdv': result.chart_metrics.fdv,
+            'pairs_count': result.chart_metrics.pairs_count,
+            'volume_24h': result.chart_metrics.volume_24h,
+            'dex_platform': result.chart_metrics.dex_platform,
+            
+            'overall_risk_score': result.overall_risk_score,
+            'risk_rating': result.risk_rating,
+            'risk_factors': struct.pack('<10B', *(
+                min(255, max(0, int(getattr(result.risk_factors, name))))
+                for name in _RISK_FIELDS
+            )),
+            
+            # Compact separators: the flag arrays are decoded on
+            # every screening pass, so smaller text means fewer
+            # pages read and less to parse
+            'red_flags': json.dumps(result.red_flags, separators=(',', ':')),
+            'green_flags': json.dumps(result.green_flags, separators=(',', ':')),
+            'volume_insights': json.dumps(result.volume_insights, separators=(',', ':')),
+            'recommendation': result.recommendation,
+            'risk_reward_ratio': result.risk_reward_ratio,
+            'raw_analysis': self._compress_raw(result) if save_raw else None
+        }
+        
+        # Insert or replace
+        cursor.execute(SQL_INSERT_ANALYSIS, data)
+        
+        # Save volume data for all timeframes in one executemany —
+        # a single statement prepare instead of one per timeframe,
+        # and all rows commit with the analysis in one transaction
+        volume_rows = [
+            (
+                result.contract_address,
+                tf_name,
+                tf_data.total_volume,
+                tf_data.avg_volume,
+                tf_data.volume_spikes,
+                tf_data.suspicious_volume_pattern,
+                tf_data.volume_trend,
+                tf_data.buy_sell_ratio,
+                tf_data.liquidity_depth,
+                tf_data.price_volatility,
+                result.timestamp
+            )
+            for tf_name, tf_data in result.chart_metrics.timeframes.items()
+        ]
+        cursor.executemany(SQL_INSERT_VOLUME, volume_rows)
+        
+        # Save to risk history
+        cursor.execute(SQL_INSERT_HISTORY, (
+            result.contract_address,
+            result.timestamp,
+            result.overall_risk_score,
+            result.risk_rating,
+            result.chart_metrics.current_price,
+            result.chart_metrics.liquidity_usd,
+            result.chart_metrics.volume_24h
+        ))
     
+    def close(self):
+        """Refresh query-planner statistics and close the connection.
+
+        Registered with atexit so long-running processes leave fresh stats
+        behind for the next session's plans.
+        """
+        try:
+            self.flush()
+            self._conn.execute("PRAGMA optimize")
+            self._read_conn.close()
+            self._conn.close()
+        except sqlite3.ProgrammingError:
+            pass  # already closed
+
     def get_analysis(self, contract_address: str) -> Optional[Dict]:
         """Get analysis for a specific contract."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connect() as conn:
             cursor = conn.cursor()
             
-            cursor.execute('''
-                SELECT * FROM contract_analysis WHERE contract_address = ?
-            ''', (contract_address,))
+            cursor.execute(SQL_GET_ANALYSIS, (contract_address,))
             
             row = cursor.fetchone()
             if row:
-                return dict(row)
+                analysis = dict(row)
+                packed = analysis.get('risk_factors')
+                if isinstance(packed, bytes):
+                    analysis.update(self.unpack_risk_factors(packed))
+                return analysis
             return None
+
+    @staticmethod
+    def unpack_risk_factors(blob: bytes) -> Dict[str, int]:
+        """Expand a packed risk_factors BLOB into named 0-100 scores."""
+        return dict(zip(_RISK_FIELDS, struct.unpack('<10B', blob)))
     
+    async def get_analysis_async(self, contract_address: str) -> Optional[Dict]:
+        """Async wrapper for get_analysis.
+
+        Runs the sync SQLite call in a worker thread so async scanners can
+        fan out lookups with asyncio.gather (behind a Semaphore) without
+        blocking the event loop.
+        """
+        return await asyncio.to_thread(self.get_analysis, contract_address)
+
+    def get_analyses_bulk(self, contract_addresses: List[str]) -> Dict[str, Dict]:
+        """Get analyses for many contracts in one round-trip.
+
+        Chunks the IN (...) list to stay under SQLite's bound-variable
+        limit. Returns a mapping of contract_address -> analysis dict;
+        addresses with no analysis are simply absent.
+        """
+        analyses: Dict[str, Dict] = {}
+        if not contract_addresses:
+            return analyses
+
+        with self._connect() as conn:
+            cursor = conn.cursor()
+
+            chunk_size = 500
+            for i in range(0, len(contract_addresses), chunk_size):
+                chunk = contract_addresses[i:i + chunk_size]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f'''
+                    SELECT * FROM contract_analysis
+                    WHERE contract_address IN ({placeholders})
+                ''', chunk)
+
+                for row in _rows_as_dicts(cursor):
+                    analyses[row["contract_address"]] = row
+
+        return analyses
+
     def get_volume_data(self, contract_address: str) -> List[Dict]:
         """Get volume data for a specific contract."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -290,12 +619,11 @@ class ContractDatabase:
                 ORDER BY timeframe
             ''', (contract_address,))
             
-            return [dict(row) for row in cursor.fetchall()]
+            return _rows_as_dicts(cursor)
     
     def get_risk_history(self, contract_address: str) -> List[Dict]:
         """Get risk score history for a contract."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -304,41 +632,76 @@ class ContractDatabase:
                 ORDER BY timestamp DESC
             ''', (contract_address,))
             
-            return [dict(row) for row in cursor.fetchall()]
+            return _rows_as_dicts(cursor)
     
-    def get_all_contracts(self, limit: int = 100, order_by: str = "timestamp") -> List[Dict]:
-        """Get all analyzed contracts."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+    def get_all_contracts(self, limit: int = 100, order_by: str = "timestamp") -> Iterator[Dict]:
+        """Stream all analyzed contracts.
+
+        Yields rows straight off the cursor so peak memory tracks what the
+        caller keeps, not the full result set; wrap in list() if you need
+        random access or len().
+        """
+        with self._connect() as conn:
             cursor = conn.cursor()
-            
-            valid_columns = ['timestamp', 'overall_risk_score', 'liquidity_usd', 'volume_24h']
-            if order_by not in valid_columns:
-                order_by = 'timestamp'
-            
-            cursor.execute(f'''
-                SELECT 
-                    contract_address,
-                    token_name,
-                    token_symbol,
-                    timestamp,
-                    overall_risk_score,
-                    risk_rating,
-                    current_price,
-                    liquidity_usd,
-                    volume_24h,
-                    price_change_24h
-                FROM contract_analysis
-                ORDER BY {order_by} DESC
-                LIMIT ?
-            ''', (limit,))
-            
-            return [dict(row) for row in cursor.fetchall()]
+
+            sql = SQL_LIST_CONTRACTS.get(order_by, SQL_LIST_CONTRACTS['timestamp'])
+            cursor.execute(sql, (limit,))
+
+            cursor.row_factory = None
+            cols = tuple(d[0] for d in cursor.description)
+            for row in cursor:
+                yield dict(zip(cols, row))
     
+    def get_qualified_analyses(self, max_risk: int = 40, min_liquidity: float = 100000,
+                               min_market_cap: float = 100000, min_volume: float = 30000,
+                               limit: int = 1000) -> List[Dict]:
+        """Get full analyses that pass the compounding qualification filters.
+
+        Filtering happens in SQL (indexed on overall_risk_score) so callers
+        avoid the per-contract get_analysis round-trips.
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                SELECT * FROM contract_analysis
+                WHERE overall_risk_score <= ?
+                  AND liquidity_usd >= ?
+                  AND market_cap >= ?
+                  AND volume_24h >= ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+            ''', (max_risk, min_liquidity, min_market_cap, min_volume, limit))
+
+            return _rows_as_dicts(cursor)
+
+    def get_qualifying_analyses(self, max_risk: int = 32, min_liquidity: float = 200000,
+                                min_volume: float = 50000, max_volatility: float = 25,
+                                limit: int = 1000) -> List[Dict]:
+        """Get analyses passing the conservative numeric gates.
+
+        Pushes the cheap predicates (risk, liquidity, volume, |24h move|)
+        into the WHERE clause so Python only sees rows that can still
+        qualify; JSON flag checks stay with the caller.
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                SELECT * FROM contract_analysis
+                WHERE overall_risk_score <= ?
+                  AND liquidity_usd >= ?
+                  AND volume_24h >= ?
+                  AND ABS(price_change_24h) <= ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+            ''', (max_risk, min_liquidity, min_volume, max_volatility, limit))
+
+            return _rows_as_dicts(cursor)
+
     def get_by_risk_rating(self, rating: str) -> List[Dict]:
         """Get contracts by risk rating (LOW, MEDIUM, HIGH, EXTREME)."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -347,12 +710,11 @@ class ContractDatabase:
                 ORDER BY overall_risk_score ASC
             ''', (rating,))
             
-            return [dict(row) for row in cursor.fetchall()]
+            return _rows_as_dicts(cursor)
     
     def get_lowest_risk(self, min_liquidity: float = 10000, limit: int = 10) -> List[Dict]:
         """Get lowest risk contracts with minimum liquidity."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -362,81 +724,135 @@ class ContractDatabase:
                 LIMIT ?
             ''', (min_liquidity, limit))
             
-            return [dict(row) for row in cursor.fetchall()]
+            return _rows_as_dicts(cursor)
     
     def add_to_blacklist(self, contract_address: str, reason: str, source: str = "manual"):
         """Add a contract to the blacklist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 INSERT OR REPLACE INTO blacklist (contract_address, reason, source)
                 VALUES (?, ?, ?)
             ''', (contract_address, reason, source))
             conn.commit()
+        self._blacklist.add(contract_address)
+        self._stats_cached.cache_clear()
     
     def is_blacklisted(self, contract_address: str) -> bool:
-        """Check if a contract is blacklisted."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                'SELECT 1 FROM blacklist WHERE contract_address = ?',
-                (contract_address,)
-            )
-            return cursor.fetchone() is not None
+        """Check if a contract is blacklisted (in-memory set lookup)."""
+        return contract_address in self._blacklist
     
     def get_statistics(self) -> Dict:
-        """Get database statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        """Get database statistics.
+
+        Results are cached for ~10 s (keyed on a coarse time bucket) so a
+        dashboard polling this endpoint pays for the aggregate queries
+        once per window; writes clear the cache for freshness.
+        """
+        return self._stats_cached(int(time.time()) // 10)
+
+    @functools.lru_cache(maxsize=4)
+    def _stats_cached(self, bucket: int) -> Dict:
+        """Compute the statistics dict for one 10-second bucket.
+
+        The three scalar aggregates ride in a single compound SELECT,
+        leaving only the GROUP BY as a second statement — two round
+        trips instead of four.
+        """
+        with self._connect() as conn:
             cursor = conn.cursor()
-            
-            stats = {}
-            
-            # Total contracts
-            cursor.execute('SELECT COUNT(*) FROM contract_analysis')
-            stats['total_contracts'] = cursor.fetchone()[0]
-            
-            # By risk rating
+
+            cursor.execute('''
+                SELECT
+                    (SELECT COUNT(*) FROM contract_analysis),
+                    (SELECT AVG(overall_risk_score) FROM contract_analysis),
+                    (SELECT COUNT(*) FROM blacklist)
+            ''')
+            total, avg_risk, blacklisted = cursor.fetchone()
+
             cursor.execute('''
-                SELECT risk_rating, COUNT(*) 
-                FROM contract_analysis 
+                SELECT risk_rating, COUNT(*)
+                FROM contract_analysis
                 GROUP BY risk_rating
             ''')
-            stats['by_rating'] = dict(cursor.fetchall())
-            
-            # Average risk score
-            cursor.execute('SELECT AVG(overall_risk_score) FROM contract_analysis')
-            stats['avg_risk_score'] = cursor.fetchone()[0] or 0
-            
-            # Blacklist count
-            cursor.execute('SELECT COUNT(*) FROM blacklist')
-            stats['blacklisted_count'] = cursor.fetchone()[0]
-            
-            return stats
+
+            return {
+                'total_contracts': total,
+                'by_rating': dict(cursor.fetchall()),
+                'avg_risk_score': avg_risk or 0,
+                'blacklisted_count': blacklisted,
+            }
     
+    def _export_row(self, row) -> Dict:
+        """Decode a row's binary columns for JSON export.
+
+        The packed risk_factors BLOB expands back into its ten named
+        scores and compressed raw_analysis decompresses to the original
+        JSON object — mirroring what get_analysis does for reads, so the
+        export stays plain JSON rather than bytes reprs.
+        """
+        d = dict(row)
+        packed = d.pop('risk_factors', None)
+        if isinstance(packed, bytes):
+            d.update(self.unpack_risk_factors(packed))
+        raw = d.get('raw_analysis')
+        if isinstance(raw, bytes):
+            d['raw_analysis'] = self.load_raw_analysis(raw)
+        return d
+
     def export_to_json(self, filepath: str):
-        """Export all data to JSON."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        """Export all data to JSON.
+
+        Rows are streamed in fetchmany batches and serialized as they
+        arrive, so the export holds at most one batch in memory instead
+        of materializing all three tables.
+        """
+        if orjson is not None:
+            dumps = lambda obj: orjson.dumps(obj, default=str).decode()
+        else:
+            dumps = lambda obj: json.dumps(obj, default=str)
+
+        tables = (
+            ('analyses', 'contract_analysis'),
+            ('volume_data', 'volume_data'),
+            ('risk_history', 'risk_history'),
+        )
+
+        with self._connect() as conn, open(filepath, 'w') as f:
             cursor = conn.cursor()
-            
-            cursor.execute('SELECT * FROM contract_analysis')
-            analyses = [dict(row) for row in cursor.fetchall()]
-            
-            cursor.execute('SELECT * FROM volume_data')
-            volumes = [dict(row) for row in cursor.fetchall()]
-            
-            cursor.execute('SELECT * FROM risk_history')
-            history = [dict(row) for row in cursor.fetchall()]
-            
-            export_data = {
-                'export_timestamp': datetime.now().isoformat(),
-                'analyses': analyses,
-                'volume_data': volumes,
-                'risk_history': history
-            }
-            
-            with open(filepath, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
+            f.write('{"export_timestamp": %s' % dumps(datetime.now().isoformat()))
+            for key, table in tables:
+                f.write(', "%s": [' % key)
+                cursor.execute(f'SELECT * FROM {table}')
+                first = True
+                while batch := cursor.fetchmany(2000):
+                    if not first:
+                        f.write(',')
+                    f.write(','.join(dumps(self._export_row(row)) for row in batch))
+                    first = False
+                f.write(']')
+            f.write('}')
+
+_shared_db: Optional[ContractDatabase] = None
+_shared_db_lock = threading.Lock()
+
+
+def get_database() -> ContractDatabase:
+    """Return the process-wide shared ContractDatabase.
+
+    Constructing ContractDatabase is deliberately front-loaded — one
+    long-lived connection, DDL plus ANALYZE, the blacklist load, a
+    writer thread and an atexit hook — so per-save construction on hot
+    paths would leak threads and re-run that setup for every token.
+    Anything that just wants a handle on the default database should
+    come through here.
+    """
+    global _shared_db
+    with _shared_db_lock:
+        if _shared_db is None:
+            _shared_db = ContractDatabase()
+        return _shared_db
+
 
 def main():
     """CLI for database operations."""
@@ -467,24 +883,30 @@ def main():
             print(f"  {rating}: {count}")
     
     elif cmd == "list":
-        contracts = db.get_all_contracts(limit=20)
-        print("\n📋 Recent Analyses")
-        print("=" * 100)
-        print(f"{'Contract':<44}{'Symbol':<10}{'Risk':<8}{'Rating':<10}{'Liquidity':<15}{'Volume 24h':<15}")
-        print("-" * 100)
-        for c in contracts:
+        # Buffer the table and write it in one syscall instead of one
+        # print per row
+        lines = [
+            "\n📋 Recent Analyses",
+            "=" * 100,
+            f"{'Contract':<44}{'Symbol':<10}{'Risk':<8}{'Rating':<10}{'Liquidity':<15}{'Volume 24h':<15}",
+            "-" * 100,
+        ]
+        for c in db.get_all_contracts(limit=20):
             short_addr = f"{c['contract_address'][:40]}..."
-            print(f"{short_addr:<44}{c['token_symbol']:<10}{c['overall_risk_score']:<8}{c['risk_rating']:<10}${c['liquidity_usd']:>12,.0f}${c['volume_24h']:>12,.0f}")
-    
+            lines.append(f"{short_addr:<44}{c['token_symbol']:<10}{c['overall_risk_score']:<8}{c['risk_rating']:<10}${c['liquidity_usd']:>12,.0f}${c['volume_24h']:>12,.0f}")
+        sys.stdout.write("\n".join(lines) + "\n")
+
     elif cmd == "low-risk":
-        contracts = db.get_lowest_risk(min_liquidity=5000, limit=10)
-        print("\n🟢 Lowest Risk Contracts")
-        print("=" * 100)
-        print(f"{'Contract':<44}{'Symbol':<10}{'Risk':<8}{'Liquidity':<15}{'Price':<12}")
-        print("-" * 100)
-        for c in contracts:
+        lines = [
+            "\n🟢 Lowest Risk Contracts",
+            "=" * 100,
+            f"{'Contract':<44}{'Symbol':<10}{'Risk':<8}{'Liquidity':<15}{'Price':<12}",
+            "-" * 100,
+        ]
+        for c in db.get_lowest_risk(min_liquidity=5000, limit=10):
             short_addr = f"{c['contract_address'][:40]}..."
-            print(f"{short_addr:<44}{c['token_symbol']:<10}{c['overall_risk_score']:<8}${c['liquidity_usd']:>12,.0f}${c['current_price']:>10.6f}")
+            lines.append(f"{short_addr:<44}{c['token_symbol']:<10}{c['overall_risk_score']:<8}${c['liquidity_usd']:>12,.0f}${c['current_price']:>10.6f}")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     elif cmd == "get" and len(sys.argv) > 2:
         addr = sys.argv[2]
@@ -5,18 +5,44 @@ Scans large batches of tokens and adds them to database
 """
 
 import asyncio
+import heapq
 import json
+import re
 import sys
 import os
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Iterator, Set, Optional
 from datetime import datetime
 import aiohttp
-from database import ContractDatabase
+import numpy as np
+from database import get_database
 from analyze_contract import SolanaContractAnalyzer
 
+try:
+    # libuv-based event loop: one fewer syscall per I/O on this
+    # network-bound scan; silently falls back to the stdlib loop
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Base58-encoded Solana pubkey (no 0, O, I or l), 32-44 chars
+_B58_ADDR = re.compile(r'^[1-9A-HJ-NP-Za-km-z]{32,44}$')
+
+# Report furniture, built once instead of per print call
+SEP80 = "-" * 80
+SEP_EQ = "=" * 80
+REPORT_HEADER = f"{'Contract':<44}{'Risk':<8}{'Liquidity':<15}{'Price':<12}"
+
+# (max risk, min liquidity, label) checked in order — first match wins
+_CLASSIFICATIONS = (
+    (30, 200_000, "💎 CONSERVATIVE GEM"),
+    (35, 100_000, "⭐ GEM"),
+    (40, 0, "✓ TRADEABLE"),
+)
+
 # Comprehensive token list for Solana
 # Mix of trending, popular, and random tokens
-DEFAULT_TOKEN_BATCH = [
+DEFAULT_TOKEN_BATCH: tuple = (
     # More DeFi tokens
     "orcaEKTdK7LKz57vaAYr9QeNsVEPfiu6QeMU1kektZE",  # ORCA
     "SRMuApVNdxXokk5GT7XD5cUUgXMBCoAz2LHeuOXnTKC",  # SRM
@@ -68,140 +94,224 @@ DEFAULT_TOKEN_BATCH = [
     "COMP0x7h1h4h5g6j7k8l9m0n1b2v3c4x5z6a7s8d9f0i9",  # COMP (Solana)
     "MKR1x7h1h4h5g6j7k8l9m0n1b2v3c4x5z6a7s8d9f0j0",   # MKR (Solana)
     "SNX2x7h1h4h5g6j7k8l9m0n1b2v3c4x5z6a7s8d9f0j1",   # SNX (Solana)
-]
+)
+# Order-preserving dedupe so a copy-pasted duplicate never gets
+# scanned (and counted) twice
+DEFAULT_TOKEN_BATCH = tuple(dict.fromkeys(DEFAULT_TOKEN_BATCH))
 
 class MassScanner:
     def __init__(self):
         self.session: Optional[aiohttp.ClientSession] = None
-        self.db = ContractDatabase()
+        self.analyzer: Optional[SolanaContractAnalyzer] = None
+        # Shared process-wide database: the analyzer's saves must land
+        # on this same writer queue for the final report's flush()
+        # barrier to mean anything
+        self.db = get_database()
+        # Addresses seen this run — a re-scan of a known token becomes a
+        # dict hit instead of a SQLite query
+        self._analysis_cache: Dict[str, Dict] = {}
+        # Caps in-flight upstream requests; resized by scan_batch
+        self.sem = asyncio.Semaphore(5)
         self.success_count = 0
         self.fail_count = 0
         self.gem_count = 0
         self.conservative_count = 0
-    
+
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # One session + connection pool for the whole scan: every token
+        # reuses warm TCP/TLS connections instead of handshaking from
+        # scratch, which dominates wall time on this network-bound path
+        connector = aiohttp.TCPConnector(
+            limit=100, limit_per_host=10, enable_cleanup_closed=True
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=60, connect=10)
+        )
+        self.analyzer = SolanaContractAnalyzer(session=self.session,
+                                               db=self.db)
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
             await self.session.close()
     
-    def load_token_list(self, filepath: str) -> List[str]:
+    @staticmethod
+    def iter_token_list(filepath: str) -> Iterator[str]:
+        """Stream valid addresses from a token file.
+
+        Yields line by line so huge lists never sit in memory twice,
+        and validates each entry as a base58 pubkey rather than the old
+        len > 30 heuristic that let garbage lines through.
+        """
+        with open(filepath, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#') and _B58_ADDR.match(line):
+                    yield line
+
+    @staticmethod
+    def load_token_list(filepath: str) -> List[str]:
         """Load tokens from file."""
-        tokens = []
         try:
-            with open(filepath, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and len(line) > 30:
-                        tokens.append(line)
+            return list(MassScanner.iter_token_list(filepath))
         except FileNotFoundError:
             print(f"File not found: {filepath}")
-        return tokens
+            return []
     
     async def analyze_single(self, token_address: str) -> Optional[Dict]:
-        """Analyze a single token with error handling."""
-        try:
-            async with SolanaContractAnalyzer() as analyzer:
-                result = await analyzer.analyze(token_address)
-                return self.db.get_analysis(token_address)
-        except Exception as e:
-            print(f"      ❌ Error: {str(e)[:40]}")
-            return None
+        """Analyze a single token, retrying transient network errors.
+
+        Connection errors and timeouts get three attempts with
+        exponential backoff (0.5s, 1s) so a momentary RPC blip doesn't
+        permanently mark the token as failed; anything else — including
+        bad addresses — fails immediately rather than burning retries.
+        """
+        delay = 0.5
+        for attempt in range(3):
+            try:
+                result = await self.analyzer.analyze(token_address)
+                # Build the row shape the classifier reads straight from
+                # the analyzer's result — re-selecting the row we just
+                # queued for write would cost an extra SELECT and can
+                # race the write-behind queue before the row is committed
+                return {
+                    "contract_address": result.contract_address,
+                    "overall_risk_score": result.overall_risk_score,
+                    "liquidity_usd": result.chart_metrics.liquidity_usd,
+                    "current_price": result.chart_metrics.current_price,
+                }
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == 2:
+                    print(f"      ❌ Error: {str(e)[:40]}")
+                    return None
+                await asyncio.sleep(delay)
+                delay *= 2
+            except Exception as e:
+                print(f"      ❌ Error: {str(e)[:40]}")
+                return None
     
-    def classify_token(self, analysis: Dict) -> str:
-        """Classify token type."""
-        risk = analysis.get("overall_risk_score", 100)
-        liq = analysis.get("liquidity_usd", 0)
-        
-        if risk <= 30 and liq >= 200000:
-            self.conservative_count += 1
-            return "💎 CONSERVATIVE GEM"
-        elif risk <= 35 and liq >= 100000:
-            self.gem_count += 1
-            return "⭐ GEM"
-        elif risk <= 40:
-            return "✓ TRADEABLE"
-        else:
-            return "✗ HIGH RISK"
+    @staticmethod
+    def classify_token(risk: int, liq: float) -> str:
+        """Classify token type from its risk score and liquidity.
+
+        Pure function over the module threshold table — no counter
+        side effects, so concurrent tasks and cache-hit re-checks can
+        call it freely. The gem counters are tallied once from the
+        final results in scan_batch.
+        """
+        for risk_max, liq_min, label in _CLASSIFICATIONS:
+            if risk <= risk_max and liq >= liq_min:
+                return label
+        return "✗ HIGH RISK"
     
+    async def _process_one(self, addr: str, idx: int, total: int):
+        """Analyze one token (or reuse its DB row) and classify it.
+
+        Output is buffered and returned rather than printed — with the
+        semaphore fan-out, concurrent prints interleave and serialize
+        the tasks on the stdout lock; scan_batch emits everything in
+        submission order once the gather completes.
+        """
+        async with self.sem:
+            lines = [f"  [{idx}/{total}] {addr[:20]}..."]
+
+            # Known rows were bulk-fetched into the cache by scan_batch
+            existing = self._analysis_cache.get(addr)
+            if existing:
+                # Unpack each field once; classify and the log line
+                # reuse the locals instead of re-hashing the dict
+                risk = existing.get("overall_risk_score", 50)
+                liq = existing.get("liquidity_usd", 0)
+                classification = self.classify_token(risk, liq)
+                lines.append(f"      ✓ Already in DB | Risk: {risk} | Liq: ${liq:,.0f} | {classification}")
+                return existing, classification, lines
+
+            # Analyze new token
+            analysis = await self.analyze_single(addr)
+
+            if analysis:
+                self._analysis_cache[addr] = analysis
+                self.success_count += 1
+                risk = analysis.get("overall_risk_score", 50)
+                liq = analysis.get("liquidity_usd", 0)
+                classification = self.classify_token(risk, liq)
+                lines.append(f"      ✅ Analyzed | Risk: {risk} | Liq: ${liq:,.0f} | {classification}")
+                return analysis, classification, lines
+
+            self.fail_count += 1
+            return None, None, lines
+
     async def scan_batch(self, addresses: List[str], batch_size: int = 5):
-        """Scan tokens in batches with rate limiting."""
+        """Scan all tokens concurrently, batch_size in flight at a time.
+
+        One flat gather gated by a semaphore keeps exactly batch_size
+        requests running continuously — no burst-then-idle gaps like the
+        old fixed batches, so the same rate budget finishes sooner.
+        """
         total = len(addresses)
         print(f"\n🚀 Starting mass scan of {total} tokens")
-        print(f"📦 Batch size: {batch_size}")
+        print(f"📦 Concurrency: {batch_size}")
         print(f"⏱️  Estimated time: {total * 1.5:.0f} seconds\n")
-        
+
         results = {
             "success": [],
             "failed": [],
             "gems": [],
             "conservative": []
         }
-        
-        for i in range(0, total, batch_size):
-            batch = addresses[i:i+batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (total + batch_size - 1) // batch_size
-            
-            print(f"\n📦 Batch {batch_num}/{total_batches} ({len(batch)} tokens)")
-            print("-" * 60)
-            
-            for j, addr in enumerate(batch, 1):
-                global_idx = i + j
-                print(f"  [{global_idx}/{total}] {addr[:20]}...")
-                
-                # Check if already in database
-                existing = self.db.get_analysis(addr)
-                if existing:
-                    risk = existing.get("overall_risk_score", 50)
-                    liq = existing.get("liquidity_usd", 0)
-                    classification = self.classify_token(existing)
-                    print(f"      ✓ Already in DB | Risk: {risk} | Liq: ${liq:,.0f} | {classification}")
-                    results["success"].append(existing)
-                    
-                    if classification == "💎 CONSERVATIVE GEM":
-                        results["conservative"].append(existing)
-                    elif classification == "⭐ GEM":
-                        results["gems"].append(existing)
-                    continue
-                
-                # Analyze new token
-                analysis = await self.analyze_single(addr)
-                
-                if analysis:
-                    self.success_count += 1
-                    risk = analysis.get("overall_risk_score", 50)
-                    liq = analysis.get("liquidity_usd", 0)
-                    classification = self.classify_token(analysis)
-                    
-                    print(f"      ✅ Analyzed | Risk: {risk} | Liq: ${liq:,.0f} | {classification}")
-                    results["success"].append(analysis)
-                    
-                    if classification == "💎 CONSERVATIVE GEM":
-                        results["conservative"].append(analysis)
-                    elif classification == "⭐ GEM":
-                        results["gems"].append(analysis)
-                else:
-                    self.fail_count += 1
-                    results["failed"].append(addr)
-                
-                # Small delay within batch
-                await asyncio.sleep(0.3)
-            
-            # Longer delay between batches
-            if i + batch_size < total:
-                print(f"\n⏳ Rate limit pause (2s)...")
-                await asyncio.sleep(2)
-        
+
+        # One bulk SELECT up front partitions the run into known vs.
+        # to-analyze, so no per-address existence query runs inside the
+        # fan-out — known tokens resolve from the cache dict. Run it in
+        # a worker thread so the event loop isn't stalled while SQLite
+        # reads a large or cold database file.
+        self._analysis_cache.update(
+            await asyncio.to_thread(self.db.get_analyses_bulk, list(addresses))
+        )
+
+        self.sem = asyncio.Semaphore(batch_size)
+        outcomes = await asyncio.gather(
+            *[self._process_one(addr, idx, total)
+              for idx, addr in enumerate(addresses, 1)],
+            return_exceptions=True
+        )
+
+        out_lines = []
+        for addr, outcome in zip(addresses, outcomes):
+            if isinstance(outcome, BaseException):
+                self.fail_count += 1
+                results["failed"].append(addr)
+                out_lines.append(f"  ❌ {addr[:20]}... {str(outcome)[:40]}")
+                continue
+            analysis, classification, lines = outcome
+            out_lines.extend(lines)
+            if analysis is None:
+                results["failed"].append(addr)
+                continue
+            results["success"].append(analysis)
+            if classification == "💎 CONSERVATIVE GEM":
+                results["conservative"].append(analysis)
+            elif classification == "⭐ GEM":
+                results["gems"].append(analysis)
+        sys.stdout.write("\n".join(out_lines) + "\n")
+
+        # Tally once from the results — the old per-call increments
+        # inside classify_token double-counted cache hits
+        self.conservative_count = len(results["conservative"])
+        self.gem_count = len(results["gems"])
+
         return results
     
     def print_final_report(self, results: Dict):
         """Print comprehensive final report."""
-        print("\n" + "=" * 80)
+        # Drain the write-behind queue so the database totals below
+        # include every analysis from this scan
+        self.db.flush()
+
+        print("\n" + SEP_EQ)
         print("📊 MASS SCAN COMPLETE")
-        print("=" * 80)
+        print(SEP_EQ)
         
         total_attempted = self.success_count + self.fail_count
         
@@ -217,18 +327,22 @@ class MassScanner:
         print(f"   Total High-Quality: {len(results['conservative']) + len(results['gems'])}")
         
         print(f"\n📦 Database Status:")
-        total_in_db = len(self.db.get_all_contracts(limit=1000))
-        print(f"   Total Contracts: {total_in_db}")
+        # One fetch serves both the count here and the risk
+        # distribution below
+        all_analyses = list(self.db.get_all_contracts(limit=1000))
+        print(f"   Total Contracts: {len(all_analyses)}")
         
         # Top discoveries
         if results["conservative"]:
             print(f"\n🏆 TOP CONSERVATIVE DISCOVERIES:")
-            print("-" * 80)
-            print(f"{'Contract':<44}{'Risk':<8}{'Liquidity':<15}{'Price':<12}")
-            print("-" * 80)
+            print(SEP80)
+            print(REPORT_HEADER)
+            print(SEP80)
             
-            for gem in sorted(results["conservative"], 
-                             key=lambda x: x.get("overall_risk_score", 50))[:5]:
+            # nsmallest is O(n log 5) vs. a full O(n log n) sort for
+            # the five rows actually printed
+            for gem in heapq.nsmallest(5, results["conservative"],
+                                       key=lambda x: x.get("overall_risk_score", 50)):
                 addr = gem.get("contract_address", "")[:40]
                 risk = f"{gem.get('overall_risk_score')}/100"
                 liq = f"${gem.get('liquidity_usd', 0):,.0f}"
@@ -237,71 +351,72 @@ class MassScanner:
         
         if results["gems"]:
             print(f"\n⭐ OTHER GEMS:")
-            print("-" * 80)
-            print(f"{'Contract':<44}{'Risk':<8}{'Liquidity':<15}{'Price':<12}")
-            print("-" * 80)
+            print(SEP80)
+            print(REPORT_HEADER)
+            print(SEP80)
             
-            for gem in sorted(results["gems"], 
-                             key=lambda x: x.get("overall_risk_score", 50))[:5]:
+            for gem in heapq.nsmallest(5, results["gems"],
+                                       key=lambda x: x.get("overall_risk_score", 50)):
                 addr = gem.get("contract_address", "")[:40]
                 risk = f"{gem.get('overall_risk_score')}/100"
                 liq = f"${gem.get('liquidity_usd', 0):,.0f}"
                 price = f"${gem.get('current_price', 0):.6f}"
                 print(f"{addr:<44}{risk:<8}{liq:<15}{price:<12}")
         
-        # Risk distribution
-        all_analyses = self.db.get_all_contracts(limit=1000)
-        low = sum(1 for a in all_analyses if a.get("overall_risk_score", 50) <= 30)
-        med = sum(1 for a in all_analyses if 30 < a.get("overall_risk_score", 50) <= 40)
-        high = sum(1 for a in all_analyses if a.get("overall_risk_score", 50) > 40)
+        # Risk distribution: pull the scores into one int array and let
+        # the masked compares run as C loops — the Python-level pass
+        # starts to drag once the table grows past a few thousand rows
+        scores = np.fromiter(
+            (a.get("overall_risk_score", 50) for a in all_analyses),
+            dtype=np.int32, count=len(all_analyses)
+        )
+        low = int((scores <= 30).sum())
+        med = int(((scores > 30) & (scores <= 40)).sum())
+        high = int((scores > 40).sum())
         
         print(f"\n📊 Risk Distribution in Database:")
         print(f"   Low (≤30): {low} tokens")
         print(f"   Medium (31-40): {med} tokens")
         print(f"   High (>40): {high} tokens")
         
-        print("\n" + "=" * 80)
+        print("\n" + SEP_EQ)
         print("✅ Mass scan complete!")
-        print("=" * 80)
+        print(SEP_EQ)
         print("\n💡 Next steps:")
         print("   1. Run: python scripts/conservative_scalps.py")
         print("   2. Run: python scripts/pumpfun_screener.py")
         print("   3. Run: python scripts/scalp_strategy.py")
 
-async def main():
+async def run(addresses: List[str]):
+    """Async entry point: scan the given addresses and report."""
+    async with MassScanner() as scanner:
+        results = await scanner.scan_batch(addresses, batch_size=5)
+        scanner.print_final_report(results)
+
+def main():
+    # Parse args and load the token file before entering the event
+    # loop — plain sync setup has no business running under asyncio
     target_count = 50  # Default to 50 for practical purposes
-    
+
     if len(sys.argv) > 1:
         try:
             target_count = int(sys.argv[1])
         except ValueError:
             pass
-    
-    # Get token list
+
     if len(sys.argv) > 2:
-        token_file = sys.argv[2]
+        addresses = MassScanner.load_token_list(sys.argv[2])
     else:
-        # Try to use default list
-        token_file = None
-    
-    async with MassScanner() as scanner:
-        if token_file:
-            addresses = scanner.load_token_list(token_file)
-        else:
-            addresses = DEFAULT_TOKEN_BATCH
-        
-        # Limit to target count
-        addresses = addresses[:target_count]
-        
-        if not addresses:
-            print("❌ No tokens to scan")
-            return
-        
-        # Scan
-        results = await scanner.scan_batch(addresses, batch_size=5)
-        
-        # Report
-        scanner.print_final_report(results)
+        addresses = list(DEFAULT_TOKEN_BATCH)
+
+    # Limit to target count
+    addresses = addresses[:target_count]
+
+    if not addresses:
+        print("❌ No tokens to scan")
+        return
+
+    asyncio.run(run(addresses))
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
@@ -18,9 +18,11 @@ import os
 import sys
 import asyncio
 import argparse
+import numpy as np
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, replace
+from operator import attrgetter
 from pathlib import Path
 
 # Add parent directory to path
@@ -36,8 +38,72 @@ from scripts.smart_money_momentum_agent import (
     AgentConfig as SMAgentConfig
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional: without it the hot math below runs as plain
+    # Python, with it the same function is LLVM-compiled on first call
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        def wrap(fn):
+            return fn
+        return wrap
+
+# Confidence label -> rank used for win-rate ladders and sort keys
+_CONF_RANK = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
+
+SEP80 = "-" * 80
+SEP_EQ = "=" * 80
+
+
+@njit(cache=True)
+def _compute_trade_math(risk_score, entry_price, take_profit, stop_loss,
+                        portfolio_sol, position_pct, sol_price, conf_rank):
+    """Scalar trade math for one setup, kept free of Python objects.
+
+    Position-sizing ladder, token/TP/SL value math, R:R and the win-rate
+    ladder in one function over plain floats/ints — called up to 200
+    times per scan, and njit-compilable because nothing here touches a
+    dict or dataclass.
+    """
+    base_size = portfolio_sol * (position_pct / 100.0)
+    if risk_score <= 25:
+        multiplier = 1.0
+    elif risk_score <= 30:
+        multiplier = 0.9
+    elif risk_score <= 35:
+        multiplier = 0.75
+    else:
+        multiplier = 0.5
+    position_sol = base_size * multiplier
+
+    position_usd = position_sol * sol_price
+    token_amount = position_usd / entry_price
+    value_at_tp = token_amount * take_profit
+    value_at_sl = token_amount * stop_loss
+    potential_profit_sol = (value_at_tp - position_usd) / sol_price
+    potential_loss_sol = (position_usd - value_at_sl) / sol_price
+    rr = potential_profit_sol / potential_loss_sol if potential_loss_sol > 0 else 0.0
+
+    if risk_score <= 25 and conf_rank >= 3:
+        win_rate = 0.70
+    elif risk_score <= 30 and conf_rank >= 2:
+        win_rate = 0.65
+    elif risk_score <= 35:
+        win_rate = 0.60
+    else:
+        win_rate = 0.55
+
+    return position_sol, potential_profit_sol, potential_loss_sol, rr, win_rate
+
+
+@dataclass(slots=True, frozen=True)
 class DailyTarget:
     """Daily profit target configuration."""
     sol_target: float = 1.0  # Target SOL profit per day
@@ -49,7 +115,7 @@ class DailyTarget:
     daily_loss_limit: float = 0.5  # Stop after 0.5 SOL loss
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeSignal:
     """Generated trade signal with full execution plan."""
     # Token info
@@ -89,9 +155,22 @@ class TradeSignal:
     # Status
     status: str = "pending"  # pending, executed, closed
     actual_profit_sol: Optional[float] = None
+    
+    # Ranking key, computed once at construction so sorts are a plain
+    # attribute read instead of a Python key function per comparison
+    _sort_key: Tuple = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self._sort_key = (self.risk_score,
+                          -_CONF_RANK.get(self.confidence, 0),
+                          -self.risk_reward_ratio)
+
+
+_SIGNAL_FIELDS = tuple(f.name for f in fields(TradeSignal)
+                       if not f.name.startswith("_"))
 
 
-@dataclass
+@dataclass(slots=True)
 class DailySession:
     """Track a single trading session."""
     date: str
@@ -156,19 +235,59 @@ class ProfitSystem:
         # Load history
         self.history = self._load_history()
         
+        # P&L column mirrored into a numpy buffer so stats are pure
+        # vectorized reductions; appends are amortized O(1)
+        n = len(self.history)
+        self._pnl_arr = np.empty(max(16, 2 * n), dtype=np.float64)
+        self._pnl_arr[:n] = np.fromiter(
+            (t["pnl_sol"] for t in self.history), dtype=np.float64, count=n)
+        self._pnl_len = n
+    
+    def _append_pnl(self, pnl_sol: float):
+        """Append one trade's P&L to the cached buffer, growing it as needed."""
+        if self._pnl_len == self._pnl_arr.shape[0]:
+            self._pnl_arr = np.concatenate(
+                [self._pnl_arr, np.empty_like(self._pnl_arr)])
+        self._pnl_arr[self._pnl_len] = pnl_sol
+        self._pnl_len += 1
+    
+    async def __aenter__(self):
+        """Open the Smart Money agent's HTTP session for the scan."""
+        if self.smart_money_agent:
+            await self.smart_money_agent.__aenter__()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.smart_money_agent:
+            await self.smart_money_agent.__aexit__(exc_type, exc_val, exc_tb)
+        
     def _load_history(self) -> List[Dict]:
-        """Load trading history."""
+        """Load trading history.
+
+        The file is JSON Lines (one trade per line) so recording a
+        trade is a single append; a legacy monolithic JSON array is
+        migrated to lines on first load, mirroring the executor's
+        history file.
+        """
         history_file = self.data_dir / "trade_history.json"
-        if history_file.exists():
-            with open(history_file) as f:
-                return json.load(f)
-        return []
+        if not history_file.exists():
+            return []
+        with open(history_file, 'rb') as f:
+            raw = f.read()
+        loads = orjson.loads if orjson is not None else json.loads
+        if raw.lstrip().startswith(b"["):
+            history = loads(raw)
+            with open(history_file, 'w') as f:
+                for record in history:
+                    f.write(json.dumps(record, default=str) + "\n")
+            return history
+        return [loads(line) for line in raw.splitlines() if line.strip()]
     
-    def _save_history(self):
-        """Save trading history."""
+    def _append_history(self, record: Dict):
+        """Append one trade record to the history file."""
         history_file = self.data_dir / "trade_history.json"
-        with open(history_file, 'w') as f:
-            json.dump(self.history, f, indent=2, default=str)
+        with open(history_file, 'a') as f:
+            f.write(json.dumps(record, default=str) + "\n")
     
     def calculate_position_size(self, portfolio_sol: float, risk_score: int) -> float:
         """Calculate position size in SOL based on risk."""
@@ -186,10 +305,15 @@ class ProfitSystem:
         
         return base_size * multiplier
     
-    def generate_signal(self, contract_address: str, portfolio_sol: float = 50.0) -> Optional[TradeSignal]:
-        """Generate a complete trade signal for a token."""
-        # Get scalp setup
-        setup = self.scalp_generator.generate_setup(contract_address)
+    def generate_signal(self, contract_address: str, portfolio_sol: float = 50.0,
+                        setup: Optional[ScalpSetup] = None) -> Optional[TradeSignal]:
+        """Generate a complete trade signal for a token.
+
+        Callers that already hold a setup (e.g. from a bulk fetch) pass
+        it in to skip the per-address DB lookup.
+        """
+        if setup is None:
+            setup = self.scalp_generator.generate_setup(contract_address)
         if not setup:
             return None
         
@@ -199,43 +323,20 @@ class ProfitSystem:
         if setup.liquidity_usd < self.config.min_liquidity:
             return None
         
-        # Calculate position size in SOL
-        position_sol = self.calculate_position_size(portfolio_sol, setup.risk_score)
-        
-        # Calculate potential profit/loss in SOL
-        # Estimate SOL value of position
-        sol_price = 180  # Approximate SOL price in USD
-        position_usd = position_sol * sol_price
-        
-        # Calculate entry value in tokens
-        token_amount = position_usd / setup.entry_price
-        
-        # Calculate profit/loss scenarios
-        value_at_tp = token_amount * setup.take_profit_2  # Use TP2 for estimate
-        value_at_sl = token_amount * setup.stop_loss
-        
-        potential_profit_usd = value_at_tp - position_usd
-        potential_loss_usd = position_usd - value_at_sl
-        
-        potential_profit_sol = potential_profit_usd / sol_price
-        potential_loss_sol = potential_loss_usd / sol_price
-        
-        # Calculate R:R
-        rr = potential_profit_sol / potential_loss_sol if potential_loss_sol > 0 else 0
-        
+        # All the scalar math in one call (sizing ladder, TP/SL values,
+        # R:R, win-rate ladder); 180 = approximate SOL price in USD
+        (position_sol, potential_profit_sol, potential_loss_sol,
+         rr, win_rate) = _compute_trade_math(
+            setup.risk_score, setup.entry_price,
+            setup.take_profit_2,  # Use TP2 as main target
+            setup.stop_loss, portfolio_sol,
+            self.config.position_size_pct, 180.0,
+            _CONF_RANK.get(setup.confidence, 0)
+        )
+
         if rr < self.config.min_risk_reward:
             return None
         
-        # Estimate win rate based on setup quality
-        if setup.risk_score <= 25 and setup.confidence == "HIGH":
-            win_rate = 0.70
-        elif setup.risk_score <= 30 and setup.confidence in ["HIGH", "MEDIUM"]:
-            win_rate = 0.65
-        elif setup.risk_score <= 35:
-            win_rate = 0.60
-        else:
-            win_rate = 0.55
-        
         return TradeSignal(
             contract_address=contract_address,
             token_symbol=setup.token_symbol,
@@ -303,59 +404,46 @@ class ProfitSystem:
             # Calculate new win rate (cap at 80%)
             new_win_rate = min(0.80, original_win_rate + sm_adjustment)
             
-            # Update reasoning with Smart Money insights
-            enhanced_reasoning = signal.reasoning.copy()
-            enhanced_warnings = signal.warnings.copy()
+            # Collect Smart Money additions; the original lists are
+            # only copied if there is actually something to append
+            added_reasoning = []
+            added_warnings = []
             
-            # Add Smart Money insights
             if sm_signal.holder_metrics.smart_money_count > 0:
-                enhanced_reasoning.append(
+                added_reasoning.append(
                     f"🧠 {sm_signal.holder_metrics.smart_money_count} smart money wallets detected"
                 )
             
             if sm_signal.holder_metrics.smart_money_buying:
-                enhanced_reasoning.append(
+                added_reasoning.append(
                     f"🟢 Smart money accumulating ({sm_signal.holder_metrics.smart_money_holdings_percent:.1f}% held)"
                 )
             
             if sm_signal.volume_momentum.volume_trend == "spiking":
-                enhanced_reasoning.append(
+                added_reasoning.append(
                     f"🔥 Volume spike: {sm_signal.volume_momentum.volume_ratio:.1f}x average"
                 )
             
             # Add warnings if red flags
-            if sm_signal.red_flags:
-                for flag in sm_signal.red_flags[:2]:
-                    if flag not in enhanced_warnings:
-                        enhanced_warnings.append(f"⚠️ {flag}")
+            for flag in sm_signal.red_flags[:2]:
+                if flag not in signal.warnings:
+                    added_warnings.append(f"⚠️ {flag}")
+            
+            # Nothing learned — hand back the original signal untouched
+            if (not added_reasoning and not added_warnings
+                    and new_win_rate == original_win_rate):
+                return signal
             
-            # Create enhanced signal
-            enhanced_signal = TradeSignal(
-                contract_address=signal.contract_address,
-                token_symbol=signal.token_symbol,
-                risk_score=signal.risk_score,
-                risk_rating=signal.risk_rating,
-                confidence=signal.confidence,
-                current_price=signal.current_price,
-                price_change_24h=signal.price_change_24h,
-                liquidity_usd=signal.liquidity_usd,
-                volume_24h=signal.volume_24h,
-                entry_price=signal.entry_price,
-                stop_loss=signal.stop_loss,
-                take_profit=signal.take_profit,
-                position_size_sol=signal.position_size_sol,
-                potential_profit_sol=signal.potential_profit_sol,
-                potential_loss_sol=signal.potential_loss_sol,
-                risk_reward_ratio=signal.risk_reward_ratio,
+            # Copy the signal, overriding only what changed;
+            # __post_init__ recomputes the sort key
+            return replace(
+                signal,
                 expected_win_rate=new_win_rate,
                 setup_type=f"{signal.setup_type}_SM",
-                max_hold_time=signal.max_hold_time,
-                reasoning=enhanced_reasoning,
-                warnings=enhanced_warnings
+                reasoning=signal.reasoning + added_reasoning,
+                warnings=signal.warnings + added_warnings
             )
             
-            return enhanced_signal
-            
         except Exception as e:
             print(f"  ⚠️ Smart Money enhancement failed: {e}")
             return signal
@@ -363,7 +451,13 @@ class ProfitSystem:
     def find_opportunities(self, portfolio_sol: float = 50.0) -> List[TradeSignal]:
         """Find all current trading opportunities (sync version)."""
         import asyncio
-        return asyncio.run(self.find_opportunities_async(portfolio_sol))
+        return asyncio.run(
+            self._run_with_agent(self.find_opportunities_async(portfolio_sol)))
+    
+    async def _run_with_agent(self, coro):
+        """Await a scan coroutine inside the Smart Money agent session."""
+        async with self:
+            return await coro
     
     async def find_opportunities_async(self, portfolio_sol: float = 50.0) -> List[TradeSignal]:
         """Find all current trading opportunities with Smart Money enhancement."""
@@ -372,48 +466,70 @@ class ProfitSystem:
             print("  🧠 Smart Money Agent enabled")
         print("=" * 80)
         
-        # Initialize Smart Money agent if needed
-        if self.smart_money_agent and not self.smart_money_agent.session:
-            await self.smart_money_agent.__aenter__()
-        
         # Get all analyzed contracts
-        contracts = self.db.get_all_contracts(limit=200)
+        contracts = list(self.db.get_all_contracts(limit=200))
         print(f"  Analyzing {len(contracts)} contracts...")
         
-        signals = []
         enhanced_count = 0
-        
-        for contract in contracts:
-            signal = self.generate_signal(contract["contract_address"], portfolio_sol)
+
+        # Base signals are sync DB/CPU work; build them first, then fan
+        # the Smart Money enhancement out concurrently — it's one HTTP
+        # analysis per signal, so awaiting serially cost N round trips
+        # One bulk DB round-trip for every candidate's setup, then
+        # pure-Python signal construction per address
+        addresses = list(dict.fromkeys(c["contract_address"] for c in contracts))
+        setups = self.scalp_generator.generate_setups_bulk(addresses)
+        base_signals = []
+        for address, setup in setups.items():
+            signal = self.generate_signal(address, portfolio_sol, setup=setup)
             if signal:
-                # Enhance with Smart Money if enabled
-                if self.use_smart_money and self.smart_money_agent:
-                    enhanced = await self.enhance_signal_with_smart_money(signal)
-                    if enhanced and enhanced.expected_win_rate > signal.expected_win_rate:
-                        enhanced_count += 1
-                        signal = enhanced
-                signals.append(signal)
-        
-        # Sort by quality (risk score, then confidence)
-        def sort_key(s):
-            conf_score = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}.get(s.confidence, 0)
-            return (s.risk_score, -conf_score, -s.risk_reward_ratio)
-        
-        signals.sort(key=sort_key)
-        
+                base_signals.append(signal)
+
+        if self.use_smart_money and self.smart_money_agent and base_signals:
+            sem = asyncio.Semaphore(20)
+
+            async def _bounded(sig):
+                async with sem:
+                    return await self.enhance_signal_with_smart_money(sig)
+
+            enhanced_results = await asyncio.gather(
+                *[_bounded(s) for s in base_signals],
+                return_exceptions=True
+            )
+            signals = []
+            for base, enhanced in zip(base_signals, enhanced_results):
+                if (not isinstance(enhanced, BaseException) and enhanced
+                        and enhanced.expected_win_rate > base.expected_win_rate):
+                    enhanced_count += 1
+                    signals.append(enhanced)
+                else:
+                    signals.append(base)
+        else:
+            signals = base_signals
+        
+        # Sort by quality (risk score asc, then confidence and R:R
+        # desc) with one C-level lexsort over contiguous arrays instead
+        # of a Python key function per element
+        if signals:
+            n = len(signals)
+            risk = np.fromiter((s.risk_score for s in signals),
+                               dtype=np.int32, count=n)
+            conf = np.fromiter((_CONF_RANK.get(s.confidence, 0) for s in signals),
+                               dtype=np.int8, count=n)
+            rr = np.fromiter((s.risk_reward_ratio for s in signals),
+                             dtype=np.float32, count=n)
+            order = np.lexsort((-rr, -conf, risk))
+            signals = [signals[i] for i in order]
+
         print(f"  ✓ Found {len(signals)} qualified signals")
         if self.use_smart_money:
             print(f"  🧠 {enhanced_count} signals enhanced with Smart Money analysis")
         
-        # Cleanup Smart Money agent
-        if self.smart_money_agent:
-            await self.smart_money_agent.__aexit__(None, None, None)
-        
         return signals
     
     def print_signal_card(self, signal: TradeSignal, rank: int):
         """Print a formatted signal card."""
-        print(f"\n{'=' * 80}")
+        lines = ["\n" + SEP_EQ]
         
         # Tier badge
         if signal.risk_score <= 25:
@@ -423,112 +539,117 @@ class ProfitSystem:
         else:
             tier = "🥈 B-TIER"
         
-        print(f"🎯 SIGNAL #{rank}: {tier} | {signal.token_symbol}")
-        print(f"   {signal.contract_address}")
-        print(f"{'=' * 80}")
+        lines.append(f"🎯 SIGNAL #{rank}: {tier} | {signal.token_symbol}")
+        lines.append(f"   {signal.contract_address}")
+        lines.append(SEP_EQ)
         
         # Risk section
         risk_emoji = "🟢" if signal.risk_score <= 25 else "🟡" if signal.risk_score <= 30 else "🟠"
-        print(f"\n{risk_emoji} Risk Profile:")
-        print(f"   Score: {signal.risk_score}/100 ({signal.risk_rating})")
-        print(f"   Confidence: {signal.confidence}")
-        print(f"   Est. Win Rate: {signal.expected_win_rate*100:.0f}%")
+        lines.append(f"\n{risk_emoji} Risk Profile:")
+        lines.append(f"   Score: {signal.risk_score}/100 ({signal.risk_rating})")
+        lines.append(f"   Confidence: {signal.confidence}")
+        lines.append(f"   Est. Win Rate: {signal.expected_win_rate*100:.0f}%")
         
         # Market data
         change_emoji = "🟢" if signal.price_change_24h > 0 else "🔴"
-        print(f"\n📊 Market Data:")
-        print(f"   Price: ${signal.current_price:.6f} ({change_emoji} {signal.price_change_24h:+.1f}%)")
-        print(f"   Liquidity: ${signal.liquidity_usd:,.0f}")
-        print(f"   24h Volume: ${signal.volume_24h:,.0f}")
+        lines.append(f"\n📊 Market Data:")
+        lines.append(f"   Price: ${signal.current_price:.6f} ({change_emoji} {signal.price_change_24h:+.1f}%)")
+        lines.append(f"   Liquidity: ${signal.liquidity_usd:,.0f}")
+        lines.append(f"   24h Volume: ${signal.volume_24h:,.0f}")
         
         # Trade plan
-        print(f"\n💰 Trade Plan ({signal.setup_type.replace('_', ' ').title()}):")
-        print(f"   🚪 Entry: ${signal.entry_price:.6f}")
-        print(f"   🛑 Stop:  ${signal.stop_loss:.6f}")
-        print(f"   ✅ Target: ${signal.take_profit:.6f}")
-        print(f"   ⏱️  Max Hold: {signal.max_hold_time}")
+        lines.append(f"\n💰 Trade Plan ({signal.setup_type.replace('_', ' ').title()}):")
+        lines.append(f"   🚪 Entry: ${signal.entry_price:.6f}")
+        lines.append(f"   🛑 Stop:  ${signal.stop_loss:.6f}")
+        lines.append(f"   ✅ Target: ${signal.take_profit:.6f}")
+        lines.append(f"   ⏱️  Max Hold: {signal.max_hold_time}")
         
         # Position sizing
-        print(f"\n💼 Position Sizing:")
-        print(f"   Size: {signal.position_size_sol:.3f} SOL")
-        print(f"   Potential Profit: +{signal.potential_profit_sol:.3f} SOL")
-        print(f"   Max Loss: -{signal.potential_loss_sol:.3f} SOL")
-        print(f"   Risk/Reward: 1:{signal.risk_reward_ratio:.1f}")
+        lines.append(f"\n💼 Position Sizing:")
+        lines.append(f"   Size: {signal.position_size_sol:.3f} SOL")
+        lines.append(f"   Potential Profit: +{signal.potential_profit_sol:.3f} SOL")
+        lines.append(f"   Max Loss: -{signal.potential_loss_sol:.3f} SOL")
+        lines.append(f"   Risk/Reward: 1:{signal.risk_reward_ratio:.1f}")
         
         # Payout toward daily target
         progress = (signal.potential_profit_sol / self.config.sol_target) * 100
-        print(f"\n🎯 Contribution to Daily Target:")
-        print(f"   This trade could contribute {progress:.1f}% of 1 SOL target")
+        lines.append(f"\n🎯 Contribution to Daily Target:")
+        lines.append(f"   This trade could contribute {progress:.1f}% of 1 SOL target")
         trades_needed = self.config.sol_target / signal.potential_profit_sol
-        print(f"   ~{trades_needed:.1f} similar wins = 1 SOL profit")
+        lines.append(f"   ~{trades_needed:.1f} similar wins = 1 SOL profit")
         
         # Reasoning
-        print(f"\n✅ Why This Setup:")
+        lines.append(f"\n✅ Why This Setup:")
         for reason in signal.reasoning[:4]:
-            print(f"   {reason}")
+            lines.append(f"   {reason}")
         
         # Warnings
         if signal.warnings:
-            print(f"\n⚠️  Warnings:")
+            lines.append(f"\n⚠️  Warnings:")
             for warning in signal.warnings[:3]:
-                print(f"   {warning}")
+                lines.append(f"   {warning}")
         
         # Execution commands
-        print(f"\n📝 Execution Commands:")
-        print(f"   # Via Trading Bot:")
-        print(f"   /buy {signal.token_symbol} {signal.position_size_sol:.2f}")
-        print(f"   /stoploss {signal.token_symbol} {signal.stop_loss:.6f} 100%")
-        print(f"   /takeprofit {signal.token_symbol} {signal.take_profit:.6f} 100%")
+        lines.append(f"\n📝 Execution Commands:")
+        lines.append(f"   # Via Trading Bot:")
+        lines.append(f"   /buy {signal.token_symbol} {signal.position_size_sol:.2f}")
+        lines.append(f"   /stoploss {signal.token_symbol} {signal.stop_loss:.6f} 100%")
+        lines.append(f"   /takeprofit {signal.token_symbol} {signal.take_profit:.6f} 100%")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def print_daily_battle_plan(self, signals: List[TradeSignal]):
         """Print the daily trading battle plan."""
-        print("\n" + "=" * 80)
-        print("📋 DAILY BATTLE PLAN - 1 SOL TARGET")
-        print("=" * 80)
+        lines = ["\n" + SEP_EQ,
+                 "📋 DAILY BATTLE PLAN - 1 SOL TARGET",
+                 SEP_EQ]
         
         if not signals:
-            print("\n❌ No qualified signals today")
-            print("   Run scanner to find new tokens")
+            lines.append("\n❌ No qualified signals today")
+            lines.append("   Run scanner to find new tokens")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
         
         # Show top signals
         top_signals = signals[:self.config.max_trades_per_day]
         
-        print(f"\n🎯 Top {len(top_signals)} Opportunities:")
-        print(f"{'Rank':<6}{'Token':<12}{'Risk':<8}{'R:R':<8}{'Profit':<12}{'Target %':<12}{'Confidence':<12}")
-        print("-" * 80)
+        lines.append(f"\n🎯 Top {len(top_signals)} Opportunities:")
+        lines.append(f"{'Rank':<6}{'Token':<12}{'Risk':<8}{'R:R':<8}{'Profit':<12}{'Target %':<12}{'Confidence':<12}")
+        lines.append(SEP80)
         
         total_potential = 0
         for i, sig in enumerate(top_signals, 1):
             total_potential += sig.potential_profit_sol
             target_pct = (sig.potential_profit_sol / self.config.sol_target) * 100
-            print(f"{i:<6}{sig.token_symbol:<12}{sig.risk_score:<8}"
-                  f"1:{sig.risk_reward_ratio:<5.1f}{sig.potential_profit_sol:<10.3f}SOL"
-                  f"{target_pct:<10.1f}%{sig.confidence:<12}")
+            lines.append(f"{i:<6}{sig.token_symbol:<12}{sig.risk_score:<8}"
+                         f"1:{sig.risk_reward_ratio:<5.1f}{sig.potential_profit_sol:<10.3f}SOL"
+                         f"{target_pct:<10.1f}%{sig.confidence:<12}")
         
-        print("-" * 80)
-        print(f"{'TOTAL POTENTIAL:':<30}{total_potential:.3f} SOL ({(total_potential/self.config.sol_target)*100:.0f}% of target)")
+        lines.append(SEP80)
+        lines.append(f"{'TOTAL POTENTIAL:':<30}{total_potential:.3f} SOL ({(total_potential/self.config.sol_target)*100:.0f}% of target)")
         
         # Strategy recommendations
-        print("\n📊 Strategy Recommendations:")
+        lines.append("\n📊 Strategy Recommendations:")
         
         if total_potential >= self.config.sol_target:
-            print("   ✅ Sufficient opportunities to hit target today")
+            lines.append("   ✅ Sufficient opportunities to hit target today")
         else:
-            print(f"   ⚠️  May need {(self.config.sol_target/total_potential):.1f}x winning trades to hit target")
+            lines.append(f"   ⚠️  May need {(self.config.sol_target/total_potential):.1f}x winning trades to hit target")
         
         # Best approach
         if len(top_signals) >= 3:
-            print("   📈 Recommended: Take first 3 signals for diversification")
+            lines.append("   📈 Recommended: Take first 3 signals for diversification")
         elif len(top_signals) >= 1:
-            print("   📈 Recommended: Take all available signals")
+            lines.append("   📈 Recommended: Take all available signals")
         
         # Risk management
-        print("\n🛡️  Risk Management:")
+        lines.append("\n🛡️  Risk Management:")
         total_risk = sum(s.potential_loss_sol for s in top_signals[:3])
-        print(f"   Total risk if all 3 hit stop: {total_risk:.3f} SOL")
-        print(f"   Daily loss limit: {self.config.daily_loss_limit} SOL")
-        print(f"   Stop trading if losses reach: {self.config.daily_loss_limit} SOL")
+        lines.append(f"   Total risk if all 3 hit stop: {total_risk:.3f} SOL")
+        lines.append(f"   Daily loss limit: {self.config.daily_loss_limit} SOL")
+        lines.append(f"   Stop trading if losses reach: {self.config.daily_loss_limit} SOL")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     async def find_smart_money_opportunities(
         self, 
@@ -544,18 +665,17 @@ class ProfitSystem:
             return []
         
         print("\n🧠 Finding Smart Money exclusive opportunities...")
-        print("=" * 80)
-        
-        await self.smart_money_agent.__aenter__()
+        print(SEP_EQ)
         
         # Get Smart Money signals
         sm_signals = await self.smart_money_agent.find_opportunities(min_score=min_score)
         
         # Convert to TradeSignals
+        known = {s.contract_address for s in self.signals}
         trade_signals = []
         for sm_signal in sm_signals:
             # Skip if we already have this token from regular scan
-            if any(s.contract_address == sm_signal.token_address for s in self.signals):
+            if sm_signal.token_address in known:
                 continue
             
             # Calculate basic position sizing
@@ -609,11 +729,25 @@ class ProfitSystem:
             
             trade_signals.append(trade_signal)
         
-        await self.smart_money_agent.__aexit__(None, None, None)
-        
         print(f"  ✓ Found {len(trade_signals)} Smart Money exclusive opportunities")
         return trade_signals
     
+    async def _run_daily_phases(self, portfolio_sol: float,
+                                include_smart_money_exclusive: bool) -> List[TradeSignal]:
+        """Run both scan phases inside a single event loop and session."""
+        async with self:
+            signals = await self.find_opportunities_async(portfolio_sol)
+            
+            # Smart Money exclusive opportunities, merged and re-sorted
+            if include_smart_money_exclusive and self.use_smart_money:
+                sm_signals = await self.find_smart_money_opportunities(
+                    min_score=70,
+                    portfolio_sol=portfolio_sol
+                )
+                signals.extend(sm_signals)
+                signals.sort(key=attrgetter("_sort_key"))
+            return signals
+    
     def run_daily_scan(self, portfolio_sol: float = 50.0, include_smart_money_exclusive: bool = True):
         """Run a complete daily scan and generate battle plan."""
         import asyncio
@@ -629,22 +763,9 @@ class ProfitSystem:
         if self.use_smart_money:
             print(f"🧠 Smart Money Enhancement: ENABLED")
         
-        # Find opportunities (async)
-        signals = asyncio.run(self.find_opportunities_async(portfolio_sol))
-        
-        # Find Smart Money exclusive opportunities
-        if include_smart_money_exclusive and self.use_smart_money:
-            sm_signals = asyncio.run(self.find_smart_money_opportunities(
-                min_score=70, 
-                portfolio_sol=portfolio_sol
-            ))
-            # Add to main list, marking as Smart Money exclusive
-            signals.extend(sm_signals)
-            # Re-sort
-            def sort_key(s):
-                conf_score = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}.get(s.confidence, 0)
-                return (s.risk_score, -conf_score, -s.risk_reward_ratio)
-            signals.sort(key=sort_key)
+        # One event loop and one agent session for both scan phases
+        signals = asyncio.run(self._run_daily_phases(
+            portfolio_sol, include_smart_money_exclusive))
         
         # Print detailed cards for top 5
         print("\n" + "=" * 80)
@@ -667,10 +788,19 @@ class ProfitSystem:
         """Save today's signals to file."""
         today = datetime.now().strftime('%Y-%m-%d')
         filename = self.data_dir / f"signals_{today}.json"
-        
-        data = [asdict(s) for s in signals]
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+
+        # Shallow per-field dicts: signal fields are scalars and flat
+        # string lists, so asdict's recursive deep copy bought nothing
+        # but allocations
+        data = [{name: getattr(s, name) for name in _SIGNAL_FIELDS}
+                for s in signals]
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2,
+                                     default=str))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
         
         print(f"\n💾 Saved {len(signals)} signals to {filename}")
     
@@ -696,7 +826,8 @@ class ProfitSystem:
         }
         
         self.history.append(trade_record)
-        self._save_history()
+        self._append_history(trade_record)
+        self._append_pnl(pnl_sol)
         
         # Print result
         emoji = "🟢" if pnl_sol > 0 else "🔴"
@@ -708,50 +839,53 @@ class ProfitSystem:
     
     def show_stats(self):
         """Show system performance statistics."""
-        print("\n" + "=" * 80)
-        print("📊 1 SOL/DAY SYSTEM STATISTICS")
-        print("=" * 80)
+        lines = ["\n" + SEP_EQ,
+                 "📊 1 SOL/DAY SYSTEM STATISTICS",
+                 SEP_EQ]
         
         if not self.history:
-            print("\n📭 No trades recorded yet")
+            lines.append("\n📭 No trades recorded yet")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
         
         total_trades = len(self.history)
-        wins = sum(1 for t in self.history if t["pnl_sol"] > 0)
+        pnl = self._pnl_arr[:self._pnl_len]
+        win_mask = pnl > 0
+        wins = int(win_mask.sum())
         losses = total_trades - wins
         win_rate = (wins / total_trades) * 100 if total_trades > 0 else 0
         
-        total_pnl = sum(t["pnl_sol"] for t in self.history)
-        avg_win = sum(t["pnl_sol"] for t in self.history if t["pnl_sol"] > 0) / wins if wins > 0 else 0
-        avg_loss = sum(t["pnl_sol"] for t in self.history if t["pnl_sol"] < 0) / losses if losses > 0 else 0
-        
-        print(f"\n📈 Overall Performance:")
-        print(f"   Total Trades: {total_trades}")
-        print(f"   Wins: {wins} | Losses: {losses}")
-        print(f"   Win Rate: {win_rate:.1f}%")
-        print(f"   Total P&L: {total_pnl:+.3f} SOL")
-        print(f"   Avg Win: +{avg_win:.3f} SOL")
-        print(f"   Avg Loss: {avg_loss:.3f} SOL")
-        
-        # Daily breakdown
-        from collections import defaultdict
-        daily_pnl = defaultdict(float)
-        for trade in self.history:
-            date = trade["timestamp"][:10]
-            daily_pnl[date] += trade["pnl_sol"]
-        
-        print(f"\n📅 Daily Results:")
-        days_hit_target = sum(1 for pnl in daily_pnl.values() if pnl >= self.config.sol_target)
-        print(f"   Days traded: {len(daily_pnl)}")
-        print(f"   Days hit 1 SOL target: {days_hit_target} ({days_hit_target/len(daily_pnl)*100:.0f}%)")
-        print(f"   Best day: {max(daily_pnl.values()):+.3f} SOL")
-        print(f"   Worst day: {min(daily_pnl.values()):+.3f} SOL")
+        total_pnl = float(pnl.sum())
+        avg_win = float(pnl[win_mask].mean()) if wins > 0 else 0
+        avg_loss = float(pnl[pnl < 0].mean()) if losses > 0 else 0
+        
+        lines.append(f"\n📈 Overall Performance:")
+        lines.append(f"   Total Trades: {total_trades}")
+        lines.append(f"   Wins: {wins} | Losses: {losses}")
+        lines.append(f"   Win Rate: {win_rate:.1f}%")
+        lines.append(f"   Total P&L: {total_pnl:+.3f} SOL")
+        lines.append(f"   Avg Win: +{avg_win:.3f} SOL")
+        lines.append(f"   Avg Loss: {avg_loss:.3f} SOL")
+        
+        # Daily breakdown: group trades by date with one bincount pass
+        dates = np.array([t["timestamp"][:10] for t in self.history])
+        days, inverse = np.unique(dates, return_inverse=True)
+        daily_pnl = np.bincount(inverse, weights=pnl)
+        
+        lines.append(f"\n📅 Daily Results:")
+        days_hit_target = int((daily_pnl >= self.config.sol_target).sum())
+        lines.append(f"   Days traded: {len(days)}")
+        lines.append(f"   Days hit 1 SOL target: {days_hit_target} ({days_hit_target/len(days)*100:.0f}%)")
+        lines.append(f"   Best day: {daily_pnl.max():+.3f} SOL")
+        lines.append(f"   Worst day: {daily_pnl.min():+.3f} SOL")
         
         # Recent trades
-        print(f"\n📝 Last 5 Trades:")
+        lines.append(f"\n📝 Last 5 Trades:")
         for trade in self.history[-5:]:
             emoji = "🟢" if trade["pnl_sol"] > 0 else "🔴"
-            print(f"   {emoji} {trade['timestamp'][:10]}: {trade['pnl_sol']:+.3f} SOL")
+            lines.append(f"   {emoji} {trade['timestamp'][:10]}: {trade['pnl_sol']:+.3f} SOL")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -317,6 +317,25 @@ class ScalpStrategyGenerator:
     def generate_setup(self, contract_address: str) -> Optional[ScalpSetup]:
         """Generate a complete scalp setup for a contract."""
         contract = self.db.get_analysis(contract_address)
+        return self._build_setup(contract_address, contract)
+    
+    def generate_setups_bulk(self, contract_addresses: List[str]) -> Dict[str, ScalpSetup]:
+        """Generate setups for many contracts with one DB round-trip.
+
+        Fetches all analyses via get_analyses_bulk instead of one query
+        per address; addresses with no analysis or no viable levels are
+        simply absent from the result.
+        """
+        analyses = self.db.get_analyses_bulk(contract_addresses)
+        setups = {}
+        for address in contract_addresses:
+            setup = self._build_setup(address, analyses.get(address))
+            if setup:
+                setups[address] = setup
+        return setups
+    
+    def _build_setup(self, contract_address: str, contract: Optional[Dict]) -> Optional[ScalpSetup]:
+        """Build a ScalpSetup from an already-fetched analysis row."""
         if not contract:
             return None
         
@@ -422,7 +441,7 @@ def main():
     generator = ScalpStrategyGenerator()
     
     # Get all contracts
-    contracts = generator.db.get_all_contracts(limit=20)
+    contracts = list(generator.db.get_all_contracts(limit=20))
     
     if not contracts:
         print("No contracts in database. Run analyze_contract.py first.")
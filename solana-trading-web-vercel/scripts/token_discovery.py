@@ -322,7 +322,7 @@ async def main():
         print("\n" + "=" * 80)
         print("✅ DISCOVERY COMPLETE")
         print("=" * 80)
-        print(f"\n📊 Database now contains {len(discovery.db.get_all_contracts(limit=1000))} tokens")
+        print(f"\n📊 Database now contains {len(list(discovery.db.get_all_contracts(limit=1000)))} tokens")
         print("\n💡 Run 'python scripts/pumpfun_screener.py' to find the best gems")
         print("💡 Run 'python scripts/scalp_strategy.py' to get trading setups")
 
@@ -226,19 +226,25 @@ class TradeExecutor:
     def _update_daily_tracker(self, pnl_sol: float):
         """Update daily tracker with trade result."""
         history_file = self.data_dir / "trade_history.json"
-        
-        history = []
+
+        # JSON Lines: one record per line, so recording a trade is a
+        # single append instead of rewriting the whole history. Migrate
+        # a legacy JSON-array file to lines once, on first touch.
         if history_file.exists():
             with open(history_file) as f:
-                history = json.load(f)
-        
-        history.append({
-            "timestamp": datetime.now().isoformat(),
-            "pnl_sol": pnl_sol
-        })
-        
-        with open(history_file, 'w') as f:
-            json.dump(history, f, indent=2)
+                first = f.read(1)
+            if first == "[":
+                with open(history_file) as f:
+                    legacy = json.load(f)
+                with open(history_file, 'w') as f:
+                    for record in legacy:
+                        f.write(json.dumps(record) + "\n")
+
+        with open(history_file, 'a') as f:
+            f.write(json.dumps({
+                "timestamp": datetime.now().isoformat(),
+                "pnl_sol": pnl_sol
+            }) + "\n")
     
     def show_open_positions(self):
         """Show currently open positions."""